@@ -1,14 +1,30 @@
-from abc import ABC
+from collections import deque
 from dataclasses import field, dataclass
-from typing import List, Any
+from typing import Deque, List, Any
 from .base_entity import BaseEntity
 import logging
 
 
-@dataclass(eq=False)
-class BaseAggregateRoot(BaseEntity, ABC):
+class _ClassLogger:
+    """类级 logger 描述符。
+
+    首次通过实例或类访问 _logger 时才创建 logger，
+    并缓存在具体类上；之后的访问是一次字典查找，
+    实例构造路径完全不涉及 logger。
+    """
+
+    def __get__(self, obj, cls) -> logging.Logger:
+        log = cls.__dict__.get('_cached_logger')
+        if log is None:
+            log = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+            cls._cached_logger = log
+        return log
+
+
+@dataclass(eq=False, slots=True)
+class BaseAggregateRoot(BaseEntity):
     """聚合根的基类。
-    
+
     聚合根特征：
     - 是实体的特殊形式
     - 维护聚合边界
@@ -16,36 +32,34 @@ class BaseAggregateRoot(BaseEntity, ABC):
     - 产生领域事件
     """
 
-    _domain_events: List[Any] = field(default_factory=list, init=False, repr=False)
-    _logger: logging.Logger = field(init=False, repr=False)
+    _domain_events: Deque[Any] = field(default_factory=deque, init=False, repr=False)
 
-    def __post_init__(self):
-        """初始化logger，使用具体类的名称"""
-        super().__post_init__() if hasattr(super(), '__post_init__') else None
-        self._logger = logging.getLogger(
-            f"{self.__class__.__module__}.{self.__class__.__name__}"
-        )
+    # 非 field 的类属性：描述符按具体类懒创建并缓存 logger
+    _logger = _ClassLogger()
 
     def add_domain_event(self, event: Any) -> None:
         """将领域事件添加到内部列表。
-        
+
         Args:
             event: 要添加的领域事件
         """
-        self._logger.debug(
-            f"Aggregate {self.__class__.__name__} (ID: {self.id}) "
-            f"adding event: {type(event).__name__}"
-        )
+        logger = self._logger
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Aggregate %s (ID: %s) adding event: %s",
+                type(self).__name__, self.id, type(event).__name__,
+            )
         self._domain_events.append(event)
 
     def clear_domain_events(self) -> None:
         """清除内部列表中的所有领域事件。"""
-        events_count = len(self._domain_events)
-        if events_count > 0:
-            self._logger.debug(
-                f"Aggregate {self.__class__.__name__} (ID: {self.id}) "
-                f"clearing {events_count} events."
-            )
+        if self._domain_events:
+            logger = self._logger
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Aggregate %s (ID: %s) clearing %d events.",
+                    type(self).__name__, self.id, len(self._domain_events),
+                )
         self._domain_events.clear()
 
     def pull_domain_events(self) -> List[Any]:
@@ -54,25 +68,25 @@ class BaseAggregateRoot(BaseEntity, ABC):
         Returns:
             领域事件列表
         """
-        events = self._domain_events[:]
+        events = list(self._domain_events)
         self.clear_domain_events()
         return events
 
     @property
     def domain_events(self) -> List[Any]:
         """返回内部领域事件列表的副本（只读）。
-        
+
         Returns:
             领域事件列表的副本
         """
-        return self._domain_events[:]
+        return list(self._domain_events)
 
     @property
     def has_domain_events(self) -> bool:
         """检查是否有待处理的领域事件。
-        
+
         Returns:
             如果有待处理的事件返回True，否则返回False
         """
-        return len(self._domain_events) > 0
+        return bool(self._domain_events)
 
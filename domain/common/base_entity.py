@@ -1,12 +1,21 @@
-from abc import ABC
 from uuid import UUID, uuid4
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, Optional
 from datetime import datetime, timezone
 
+# 预绑定的 UTC 时间工厂：partial 避免 lambda 的 Python 帧与 LOAD_GLOBAL 开销
+_UTC = timezone.utc
+_now_utc = partial(datetime.now, _UTC)
 
-@dataclass(eq=False)
-class BaseEntity(ABC):
+
+def _new_id() -> int:
+    """生成新的实体标识（UUID4 的 128 位整数形式）"""
+    return uuid4().int
+
+
+@dataclass(eq=False, slots=True)
+class BaseEntity:
     """领域实体的基类。
     
     实体特征：
@@ -14,11 +23,16 @@ class BaseEntity(ABC):
     - 基于ID的相等性比较
     - 可变状态
     - 具有生命周期
+
+    性能说明：
+    - id 内部存储为 128 位 int（UUID4 的整数形式）：int 的哈希与
+      比较是 C 级操作，省去 UUID 对象的 Python 属性链开销
+    - 序列化边界需要 UUID 时使用 uuid 属性
     """
 
-    id: UUID = field(default_factory=uuid4)
+    id: int = field(default_factory=_new_id)
     created_at: datetime = field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_now_utc,
         compare=False,
         repr=False,
     )
@@ -28,18 +42,31 @@ class BaseEntity(ABC):
         repr=False,
     )
     version: int = field(default=0, compare=False, repr=False)  # 用于乐观锁
+    _hash_cache: int = field(default=0, init=False, repr=False, compare=False)
 
     def __eq__(self, other: Any) -> bool:
         """Entities are equal if their IDs are equal."""
-        if not isinstance(other, BaseEntity):
+        if self is other:
+            return True
+        if not (type(other) is type(self) or isinstance(other, BaseEntity)):
             return NotImplemented
         return self.id == other.id
 
     def __hash__(self) -> int:
-        """Entities are hashed based on their ID."""
-        return hash(self.id)
+        """Entities are hashed based on their ID (cached after first use)."""
+        h = self._hash_cache
+        if h:
+            return h
+        h = hash(self.id)
+        self._hash_cache = h
+        return h
+
+    @property
+    def uuid(self) -> UUID:
+        """实体标识的 UUID 形式（用于序列化/对外展示）"""
+        return UUID(int=self.id)
 
     def update_timestamp(self) -> None:
         """更新修改时间戳"""
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _now_utc()
 
@@ -1,12 +1,24 @@
-from abc import ABC
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
+from functools import partial
+from types import MappingProxyType
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import ClassVar, Mapping, Optional, Any
 
+# 预绑定的 UTC 时间工厂：partial 避免 lambda 的 Python 帧与 LOAD_GLOBAL 开销
+_UTC = timezone.utc
+_now_utc = partial(datetime.now, _UTC)
 
-@dataclass(frozen=True)
-class DomainEvent(ABC):
+# 共享的空元数据哨兵：不可变单例，无元数据的事件零分配，
+# 消费方可直接 .get()/迭代，无需 `event.metadata or {}` 防御
+_EMPTY_META: Mapping[str, Any] = MappingProxyType({})
+
+# fast_create 的缺失值哨兵
+_MISSING_VALUE = object()
+
+
+@dataclass(frozen=True, slots=True)
+class DomainEvent:
     """领域事件的基类。
     
     领域事件特征：
@@ -17,27 +29,66 @@ class DomainEvent(ABC):
     """
 
     # 必需字段
-    aggregate_id: UUID  # 关联的聚合根ID
-    
+    aggregate_id: int  # 关联的聚合根ID（与 BaseEntity.id 一致的 128 位 int）
+
     # 自动生成字段
     event_id: UUID = field(default_factory=uuid4, init=False)
     occurred_on: datetime = field(
-        default_factory=lambda: datetime.now(timezone.utc), 
+        default_factory=_now_utc,
         init=False
     )
     
     # 可选字段
     correlation_id: Optional[UUID] = field(default=None)  # 用于跟踪相关事件链
     causation_id: Optional[UUID] = field(default=None)  # 触发此事件的事件ID
-    metadata: Optional[Dict[str, Any]] = field(default=None)  # 额外元数据
+    metadata: Mapping[str, Any] = field(default=_EMPTY_META)  # 额外元数据（默认共享空映射）
 
-    @property
-    def event_name(self) -> str:
-        """返回事件名称（默认为类名）"""
-        return self.__class__.__name__
+    # 类级属性：在类定义时一次性计算，访问无 property 调用开销
+    event_name: ClassVar[str] = "DomainEvent"
+    event_version: ClassVar[str] = "1.0"  # 子类可覆盖
+
+    @classmethod
+    def fast_create(cls, **kwargs):
+        """高吞吐场景的快速构造路径。
+
+        绕过 frozen dataclass 生成的 __init__（逐字段走
+        object.__setattr__ 描述符链），改为 __new__ + 单循环赋值，
+        字段规格在首次调用时计算并缓存在具体类上。
+        init=False 的字段（event_id/occurred_on）也可通过关键字
+        显式传入，便于事件流重放。
+        """
+        spec = cls.__dict__.get('_fast_fields')
+        if spec is None:
+            spec = tuple(
+                (f.name, f.default, f.default_factory) for f in fields(cls)
+            )
+            cls._fast_fields = spec
+
+        obj = cls.__new__(cls)
+        set_attr = object.__setattr__
+        get = kwargs.get
+        for name, default, factory in spec:
+            value = get(name, _MISSING_VALUE)
+            if value is _MISSING_VALUE:
+                if factory is not MISSING:
+                    value = factory()
+                elif default is not MISSING:
+                    value = default
+                else:
+                    raise TypeError(
+                        f"{cls.__name__}.fast_create() missing required field: {name!r}"
+                    )
+            set_attr(obj, name, value)
+        return obj
 
     @property
-    def event_version(self) -> str:
-        """返回事件版本，子类可覆盖"""
-        return "1.0"
+    def aggregate_uuid(self) -> UUID:
+        """聚合根标识的 UUID 形式（用于序列化/对外展示）"""
+        return UUID(int=self.aggregate_id)
+
+    def __init_subclass__(cls, **kwargs):
+        """在子类定义时预计算事件名称（默认为类名）"""
+        # 显式两参 super：slots=True 会重建类，零参 super 的 __class__ 闭包会失效
+        super(DomainEvent, cls).__init_subclass__(**kwargs)
+        cls.event_name = cls.__name__
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Optional, List
+from typing import Generic, TypeVar, Optional, Sequence
 
 try:
     # Prefer local import path if available
@@ -13,6 +13,9 @@ except Exception:  # pragma: no cover - fallback for early scaffolding
 TEntity = TypeVar("TEntity")
 TId = TypeVar("TId")
 
+# 共享的空结果：不可变元组，未命中/无结果路径零分配
+_EMPTY_RESULT: tuple = ()
+
 
 class BaseRepository(ABC, Generic[TEntity, TId]):
     """通用仓储接口（领域层）。
@@ -36,7 +39,7 @@ class BaseRepository(ABC, Generic[TEntity, TId]):
         """移除实体"""
         raise NotImplementedError
 
-    def list(self, specification: Optional[Specification] = None) -> List[TEntity]:
-        """按规约列出实体；默认返回空列表，子类可覆盖实现"""
-        return []
+    def list(self, specification: Optional[Specification] = None) -> Sequence[TEntity]:
+        """按规约列出实体；默认返回共享空序列，子类可覆盖实现"""
+        return _EMPTY_RESULT
 
@@ -1,9 +1,8 @@
-from abc import ABC
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
-class BaseValueObject(ABC):
+@dataclass(frozen=True, slots=True)
+class BaseValueObject:
     """值对象的基类。
     
     值对象特征：
@@ -1,7 +1,4 @@
-from abc import ABC
-
-
-class DomainService(ABC):
+class DomainService:
     """领域服务的基类。
     
     领域服务用于：
@@ -1,125 +1,159 @@
-from typing import Optional, Any
+import sys
+from typing import ClassVar, Optional, Any
 from abc import ABC
 
 
 class DomainException(Exception, ABC):
     """
     领域异常基类
-    
+
     所有领域层异常都应该继承此类。
     领域异常表示业务规则违反或领域逻辑错误。
+
+    性能说明：
+    - code 统一经过 sys.intern()，固定词汇表的代码可按指针比较
+    - 带 _TEMPLATE 的子类延迟格式化消息：__init__ 只存原始字段，
+      首次访问 message（或 str(exc)）时才构建字符串
     """
-    
+
+    # 子类可定义消息模板（按实例属性 format_map），实现延迟格式化
+    _TEMPLATE: ClassVar[Optional[str]] = None
+
     def __init__(
         self,
-        message: str,
+        message: Optional[str] = None,
         code: Optional[str] = None
     ):
-        self.message = message
-        self.code = code or self.__class__.__name__
-        super().__init__(self.message)
+        self._message = message
+        self.code = sys.intern(code) if code else sys.intern(self.__class__.__name__)
+        super().__init__(message) if message is not None else super().__init__()
+
+    @property
+    def message(self) -> str:
+        """异常消息（首次访问时才格式化并缓存）"""
+        msg = self._message
+        if msg is None:
+            msg = self._format_message()
+            self._message = msg
+        return msg
+
+    def _format_message(self) -> str:
+        """根据 _TEMPLATE 与实例属性构建消息，子类可覆盖"""
+        if self._TEMPLATE is None:
+            return ""
+        return self._TEMPLATE.format_map(self.__dict__)
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class EntityNotFoundException(DomainException):
     """实体未找到异常"""
-    
+
+    _TEMPLATE = "{entity_type} with id '{entity_id}' not found"
+
     def __init__(self, entity_type: str, entity_id: Any):
         self.entity_type = entity_type
         self.entity_id = entity_id
-        super().__init__(
-            message=f"{entity_type} with id '{entity_id}' not found",
-            code="ENTITY_NOT_FOUND"
-        )
+        super().__init__(code="ENTITY_NOT_FOUND")
 
 
 class AggregateNotFoundException(DomainException):
     """聚合根未找到异常"""
-    
+
+    _TEMPLATE = "{aggregate_type} aggregate with id '{aggregate_id}' not found"
+
     def __init__(self, aggregate_type: str, aggregate_id: Any):
         self.aggregate_type = aggregate_type
         self.aggregate_id = aggregate_id
-        super().__init__(
-            message=f"{aggregate_type} aggregate with id '{aggregate_id}' not found",
-            code="AGGREGATE_NOT_FOUND"
-        )
+        super().__init__(code="AGGREGATE_NOT_FOUND")
 
 
 class BusinessRuleViolationException(DomainException):
     """业务规则违反异常"""
-    
+
+    _TEMPLATE = "Business rule '{rule}' violated: {detail}"
+
     def __init__(self, rule: str, message: str):
         self.rule = rule
-        super().__init__(
-            message=f"Business rule '{rule}' violated: {message}",
-            code="BUSINESS_RULE_VIOLATION"
-        )
+        self.detail = message
+        super().__init__(code="BUSINESS_RULE_VIOLATION")
 
 
 class InvariantViolationException(DomainException):
     """不变量违反异常"""
-    
+
+    _TEMPLATE = "Invariant '{invariant}' violated: {detail}"
+
     def __init__(self, invariant: str, message: str):
         self.invariant = invariant
-        super().__init__(
-            message=f"Invariant '{invariant}' violated: {message}",
-            code="INVARIANT_VIOLATION"
-        )
+        self.detail = message
+        super().__init__(code="INVARIANT_VIOLATION")
 
 
 class DomainValidationException(DomainException):
     """领域验证异常"""
-    
+
+    _TEMPLATE = "Validation failed for {field}: {detail}"
+
     def __init__(self, field: str, value: Any, message: str):
         self.field = field
         self.value = value
-        super().__init__(
-            message=f"Validation failed for {field}: {message}",
-            code="DOMAIN_VALIDATION_ERROR"
-        )
+        self.detail = message
+        super().__init__(code="DOMAIN_VALIDATION_ERROR")
 
 
 class InvalidValueObjectException(DomainException):
     """无效值对象异常"""
-    
+
+    _TEMPLATE = "Invalid {value_object_type}: {reason}"
+
     def __init__(self, value_object_type: str, value: Any, reason: str):
         self.value_object_type = value_object_type
         self.value = value
-        super().__init__(
-            message=f"Invalid {value_object_type}: {reason}",
-            code="INVALID_VALUE_OBJECT"
-        )
+        self.reason = reason
+        super().__init__(code="INVALID_VALUE_OBJECT")
 
 
 class InvalidOperationException(DomainException):
     """无效操作异常"""
-    
+
+    _TEMPLATE = "Operation '{operation}' is invalid: {reason}"
+
     def __init__(self, operation: str, reason: str):
         self.operation = operation
-        super().__init__(
-            message=f"Operation '{operation}' is invalid: {reason}",
-            code="INVALID_OPERATION"
-        )
+        self.reason = reason
+        super().__init__(code="INVALID_OPERATION")
 
 
 class InvalidStateTransitionException(DomainException):
     """无效状态转换异常"""
-    
+
     def __init__(self, entity: str, from_state: str, to_state: str, reason: Optional[str] = None):
         self.entity = entity
         self.from_state = from_state
         self.to_state = to_state
-        message = f"Invalid state transition for {entity} from '{from_state}' to '{to_state}'"
-        if reason:
-            message += f": {reason}"
-        super().__init__(
-            message=message,
-            code="INVALID_STATE_TRANSITION"
+        self.reason = reason
+        super().__init__(code="INVALID_STATE_TRANSITION")
+
+    def _format_message(self) -> str:
+        message = (
+            f"Invalid state transition for {self.entity} "
+            f"from '{self.from_state}' to '{self.to_state}'"
         )
+        if self.reason:
+            message += f": {self.reason}"
+        return message
 
 
 class AggregateVersionMismatchException(DomainException):
     """聚合版本不匹配异常（用于乐观锁）"""
-    
+
+    _TEMPLATE = (
+        "{aggregate_type} with id '{aggregate_id}' version mismatch. "
+        "Expected: {expected_version}, Actual: {actual_version}"
+    )
+
     def __init__(
         self,
         aggregate_type: str,
@@ -131,49 +165,41 @@ class AggregateVersionMismatchException(DomainException):
         self.aggregate_id = aggregate_id
         self.expected_version = expected_version
         self.actual_version = actual_version
-        super().__init__(
-            message=(
-                f"{aggregate_type} with id '{aggregate_id}' version mismatch. "
-                f"Expected: {expected_version}, Actual: {actual_version}"
-            ),
-            code="AGGREGATE_VERSION_MISMATCH"
-        )
+        super().__init__(code="AGGREGATE_VERSION_MISMATCH")
 
 
 class DuplicateEntityException(DomainException):
     """实体重复异常"""
-    
+
+    _TEMPLATE = "{entity_type} with {identifier_field} '{identifier_value}' already exists"
+
     def __init__(self, entity_type: str, identifier_field: str, identifier_value: Any):
         self.entity_type = entity_type
         self.identifier_field = identifier_field
         self.identifier_value = identifier_value
-        super().__init__(
-            message=f"{entity_type} with {identifier_field} '{identifier_value}' already exists",
-            code="DUPLICATE_ENTITY"
-        )
+        super().__init__(code="DUPLICATE_ENTITY")
 
 
 class DomainEventException(DomainException):
     """领域事件异常"""
-    
+
+    _TEMPLATE = "Domain event '{event_type}' error: {detail}"
+
     def __init__(self, event_type: str, message: str):
         self.event_type = event_type
-        super().__init__(
-            message=f"Domain event '{event_type}' error: {message}",
-            code="DOMAIN_EVENT_ERROR"
-        )
+        self.detail = message
+        super().__init__(code="DOMAIN_EVENT_ERROR")
 
 
 class SpecificationNotSatisfiedException(DomainException):
     """规约不满足异常"""
 
+    _TEMPLATE = "Entity does not satisfy specification '{specification}'"
+
     def __init__(self, specification: str, entity: Any):
         self.specification = specification
         self.entity = entity
-        super().__init__(
-            message=f"Entity does not satisfy specification '{specification}'",
-            code="SPECIFICATION_NOT_SATISFIED"
-        )
+        super().__init__(code="SPECIFICATION_NOT_SATISFIED")
 
 
 # ========== 认证异常 ==========
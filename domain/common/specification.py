@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Callable, Generic, Iterable, List, TypeVar
 
 
 T = TypeVar('T')
@@ -26,27 +26,96 @@ class Specification(ABC, Generic[T]):
         """
         raise NotImplementedError
 
-    def and_(self, other: 'Specification[T]') -> 'AndSpecification[T]':
-        """与操作：两个规约都必须满足"""
-        return AndSpecification(self, other)
+    def and_(self, other: 'Specification[T]') -> 'Specification[T]':
+        """与操作：两个规约都必须满足
 
-    def or_(self, other: 'Specification[T]') -> 'OrSpecification[T]':
-        """或操作：至少一个规约必须满足"""
-        return OrSpecification(self, other)
+        应用代数化简（x & AlwaysTrue == x，x & AlwaysFalse == AlwaysFalse），
+        并将嵌套的与链展平为单个 n 元规约，避免逐候选递归调用。
+        """
+        if isinstance(other, AlwaysTrueSpecification):
+            return self
+        if isinstance(self, AlwaysTrueSpecification):
+            return other
+        if isinstance(self, AlwaysFalseSpecification):
+            return self
+        if isinstance(other, AlwaysFalseSpecification):
+            return other
+        return _AllSpecification(self._and_operands() + other._and_operands())
+
+    def or_(self, other: 'Specification[T]') -> 'Specification[T]':
+        """或操作：至少一个规约必须满足
+
+        应用代数化简（x | AlwaysFalse == x，x | AlwaysTrue == AlwaysTrue），
+        并将嵌套的或链展平为单个 n 元规约。
+        """
+        if isinstance(other, AlwaysFalseSpecification):
+            return self
+        if isinstance(self, AlwaysFalseSpecification):
+            return other
+        if isinstance(self, AlwaysTrueSpecification):
+            return self
+        if isinstance(other, AlwaysTrueSpecification):
+            return other
+        return _AnySpecification(self._or_operands() + other._or_operands())
 
-    def not_(self) -> 'NotSpecification[T]':
-        """非操作：规约不能满足"""
+    def not_(self) -> 'Specification[T]':
+        """非操作：规约不能满足（双重否定直接返回原规约）"""
         return NotSpecification(self)
-    
-    def __and__(self, other: 'Specification[T]') -> 'AndSpecification[T]':
+
+    def _and_operands(self) -> tuple:
+        """返回参与与链展平的子规约元组"""
+        return (self,)
+
+    def _or_operands(self) -> tuple:
+        """返回参与或链展平的子规约元组"""
+        return (self,)
+
+    def compile(self) -> Callable[[Iterable[T]], List[T]]:
+        """将规约树编译为专用的批量过滤函数。
+
+        遍历组合树收集叶子谓词，生成一个使用 Python 原生
+        and/or/not 短路求值的列表推导式，再 exec 为单个函数。
+        组合规约对每个候选只执行一次推导式迭代，而不是
+        逐节点的递归方法调用。编译结果缓存在规约实例上。
+
+        Returns:
+            接受可迭代对象、返回满足规约的候选列表的函数
+        """
+        compiled = getattr(self, '_compiled_filter', None)
+        if compiled is not None:
+            return compiled
+
+        predicates: list = []
+        expr = self._compile_expr(predicates)
+        namespace = {f"_p{i}": fn for i, fn in enumerate(predicates)}
+        source = (
+            "def _filter(candidates):\n"
+            f"    return [c for c in candidates if {expr}]"
+        )
+        exec(source, namespace)
+        compiled = namespace['_filter']
+        self._compiled_filter = compiled
+        return compiled
+
+    def filter(self, candidates: Iterable[T]) -> List[T]:
+        """批量过滤候选对象，返回满足规约的列表"""
+        return self.compile()(candidates)
+
+    def _compile_expr(self, predicates: list) -> str:
+        """生成本规约节点的布尔表达式片段（叶子默认为谓词调用）"""
+        index = len(predicates)
+        predicates.append(self.is_satisfied_by)
+        return f"_p{index}(c)"
+
+    def __and__(self, other: 'Specification[T]') -> 'Specification[T]':
         """支持 & 操作符"""
         return self.and_(other)
-    
-    def __or__(self, other: 'Specification[T]') -> 'OrSpecification[T]':
+
+    def __or__(self, other: 'Specification[T]') -> 'Specification[T]':
         """支持 | 操作符"""
         return self.or_(other)
-    
-    def __invert__(self) -> 'NotSpecification[T]':
+
+    def __invert__(self) -> 'Specification[T]':
         """支持 ~ 操作符"""
         return self.not_()
 
@@ -63,7 +132,13 @@ class AndSpecification(Specification[T]):
             self.left.is_satisfied_by(candidate)
             and self.right.is_satisfied_by(candidate)
         )
-    
+
+    def _and_operands(self) -> tuple:
+        return self.left._and_operands() + self.right._and_operands()
+
+    def _compile_expr(self, predicates: list) -> str:
+        return f"({self.left._compile_expr(predicates)} and {self.right._compile_expr(predicates)})"
+
     def __repr__(self) -> str:
         return f"({self.left} AND {self.right})"
 
@@ -80,7 +155,13 @@ class OrSpecification(Specification[T]):
             self.left.is_satisfied_by(candidate)
             or self.right.is_satisfied_by(candidate)
         )
-    
+
+    def _or_operands(self) -> tuple:
+        return self.left._or_operands() + self.right._or_operands()
+
+    def _compile_expr(self, predicates: list) -> str:
+        return f"({self.left._compile_expr(predicates)} or {self.right._compile_expr(predicates)})"
+
     def __repr__(self) -> str:
         return f"({self.left} OR {self.right})"
 
@@ -93,18 +174,72 @@ class NotSpecification(Specification[T]):
 
     def is_satisfied_by(self, candidate: T) -> bool:
         return not self.spec.is_satisfied_by(candidate)
-    
+
+    def not_(self) -> Specification[T]:
+        """双重否定化简：~~x == x"""
+        return self.spec
+
+    def _compile_expr(self, predicates: list) -> str:
+        return f"(not {self.spec._compile_expr(predicates)})"
+
     def __repr__(self) -> str:
         return f"(NOT {self.spec})"
 
 
+class _AllSpecification(Specification[T]):
+    """展平的 n 元与规约：所有子规约都必须满足。
+
+    在构造时预先绑定每个子规约的 is_satisfied_by 方法，
+    检查时在单个 all() 循环中短路求值，避免递归树调用。
+    """
+
+    def __init__(self, operands: tuple):
+        self.operands = tuple(operands)
+        self._fns = tuple(op.is_satisfied_by for op in self.operands)
+
+    def is_satisfied_by(self, candidate: T) -> bool:
+        return all(fn(candidate) for fn in self._fns)
+
+    def _and_operands(self) -> tuple:
+        return self.operands
+
+    def _compile_expr(self, predicates: list) -> str:
+        return "(" + " and ".join(op._compile_expr(predicates) for op in self.operands) + ")"
+
+    def __repr__(self) -> str:
+        return "(" + " AND ".join(repr(op) for op in self.operands) + ")"
+
+
+class _AnySpecification(Specification[T]):
+    """展平的 n 元或规约：至少一个子规约必须满足。"""
+
+    def __init__(self, operands: tuple):
+        self.operands = tuple(operands)
+        self._fns = tuple(op.is_satisfied_by for op in self.operands)
+
+    def is_satisfied_by(self, candidate: T) -> bool:
+        return any(fn(candidate) for fn in self._fns)
+
+    def _or_operands(self) -> tuple:
+        return self.operands
+
+    def _compile_expr(self, predicates: list) -> str:
+        return "(" + " or ".join(op._compile_expr(predicates) for op in self.operands) + ")"
+
+    def __repr__(self) -> str:
+        return "(" + " OR ".join(repr(op) for op in self.operands) + ")"
+
+
 # 常用的复合规约
 class AlwaysTrueSpecification(Specification[T]):
     """总是满足的规约"""
     
     def is_satisfied_by(self, candidate: T) -> bool:
         return True
-    
+
+    def _compile_expr(self, predicates: list) -> str:
+        return "True"
+
     def __repr__(self) -> str:
         return "AlwaysTrue"
 
@@ -114,7 +249,10 @@ class AlwaysFalseSpecification(Specification[T]):
     
     def is_satisfied_by(self, candidate: T) -> bool:
         return False
-    
+
+    def _compile_expr(self, predicates: list) -> str:
+        return "False"
+
     def __repr__(self) -> str:
         return "AlwaysFalse"
 
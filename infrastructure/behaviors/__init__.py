@@ -20,38 +20,41 @@ Pipeline 执行顺序（从外到内）：
 from .validation_behavior import (
     ValidationBehavior,
     ValidationException,
-    register_validation_behavior,
 )
 from .exception_behavior import (
     ExceptionBehavior,
     ApplicationException,
     ApplicationError,
-    register_exception_behavior,
 )
 from .transaction_behavior import (
     TransactionBehavior,
     Command,
     is_command,
-    register_transaction_behavior,
 )
 
 from infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Pipeline 顺序在此一处声明（先注册的在最外层）
+_PIPELINE = [ValidationBehavior, ExceptionBehavior, TransactionBehavior]
+
 
 def register_all_behaviors() -> None:
     """
     注册所有 Pipeline Behaviors
 
     必须在应用启动时、创建 Mediator 之前调用。
-    注册顺序决定了执行顺序（先注册的先执行）。
+    Pipeline 按 _PIPELINE 声明的顺序一次性赋值构建——没有逐个
+    insert 的位置推算，顺序确定且幂等；已存在的其他 behavior
+    （如 LoggingBehavior）保留在尾部。
     """
-    # 按顺序注册（先注册的在 pipeline 最外层）
-    register_validation_behavior()   # 1. 验证
-    register_exception_behavior()    # 2. 异常处理
-    register_transaction_behavior()  # 3. 事务
-    # LoggingBehavior 在 handler_behavior.py 中单独注册
+    from typing import Any
+    import mediatr
+
+    existing = mediatr.__behaviors__.get(Any, [])
+    tail = [b for b in existing if b not in _PIPELINE]
+    mediatr.__behaviors__[Any] = [*_PIPELINE, *tail]
 
     logger.info("All pipeline behaviors registered")
 
@@ -70,7 +73,4 @@ __all__ = [
     "is_command",
     # Registration
     "register_all_behaviors",
-    "register_validation_behavior",
-    "register_exception_behavior",
-    "register_transaction_behavior",
 ]
@@ -9,20 +9,12 @@
 执行顺序：在 ValidationBehavior 之后，LoggingBehavior 之前
 """
 
-from typing import Any, Callable, Awaitable, Dict, Type
-from dataclasses import dataclass
-
-from domain.common.exceptions import (
-    DomainException,
-    EntityNotFoundException,
-    AggregateNotFoundException,
-    BusinessRuleViolationException,
-    DomainValidationException,
-    InvalidOperationException,
-    DuplicateEntityException,
-    AggregateVersionMismatchException,
-    AuthenticationException,
-)
+from types import MappingProxyType
+from typing import Any, Callable, Awaitable, Dict, Mapping, Type
+from dataclasses import dataclass, field, replace
+
+from domain.common.exceptions import DomainException
+from infrastructure.behaviors.request_name import request_type_name
 from infrastructure.logging import get_logger
 from interfaces.api.middleware.logging_middleware import get_request_id
 
@@ -39,11 +31,7 @@ class ApplicationError:
     code: str
     message: str
     status_code: int
-    details: Dict[str, Any] = None
-
-    def __post_init__(self):
-        if self.details is None:
-            self.details = {}
+    details: Dict[str, Any] = field(default_factory=dict)
 
 
 class ApplicationException(Exception):
@@ -58,17 +46,84 @@ class ApplicationException(Exception):
         super().__init__(error.message)
 
 
+# 按具体异常类型缓存的状态码（EXCEPTION_STATUS_MAP 导入后不再变更，缓存安全）
+_status_cache: Dict[type, int] = {}
+
+# 按具体异常类型缓存的 details 属性名（dir() 反射只做一次）
+_details_attrs_cache: Dict[type, tuple] = {}
+
+# 无自定义属性的异常共享同一个不可变空映射，免去每次错误的字典分配
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
 # 领域异常 -> HTTP 状态码映射
-EXCEPTION_STATUS_MAP: Dict[Type[DomainException], int] = {
-    EntityNotFoundException: 404,
-    AggregateNotFoundException: 404,
-    BusinessRuleViolationException: 422,
-    DomainValidationException: 400,
-    InvalidOperationException: 400,
-    DuplicateEntityException: 409,
-    AggregateVersionMismatchException: 409,
-    AuthenticationException: 401,
-}
+# 懒初始化：首个领域异常出现时才 import 各具体异常类并填充，
+# 避免模块加载阶段执行整个 domain.common.exceptions 的导入链。
+EXCEPTION_STATUS_MAP: Dict[Type[DomainException], int] = {}
+
+
+# 按异常类型预装箱的错误模板：code/status_code 固定，
+# 转换时只 replace 可变字段（message/details）。与状态码映射一同懒初始化。
+_ERROR_TEMPLATES: Dict[type, ApplicationError] = {}
+
+
+# 运行时 codegen 的状态码分类函数（isinstance 梯形），
+# 随状态码映射一同懒初始化
+_classify_status: Callable[[DomainException], int] | None = None
+
+
+def _compile_status_classifier() -> Callable[[DomainException], int]:
+    """把状态码映射编译成链式 isinstance 梯形
+
+    映射只有 8 个不可变条目，codegen 成直线字节码后分类
+    不再经过字典哈希；梯形按预期频率排列（NotFound 在前），
+    且配合 _status_cache 每个异常类型最多只走一次。
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def _classify(exception):"]
+    for i, (exc_type, status_code) in enumerate(EXCEPTION_STATUS_MAP.items()):
+        name = f"_exc_{i}"
+        namespace[name] = exc_type
+        lines.append(f"    if isinstance(exception, {name}): return {status_code}")
+    lines.append("    return 400")  # 默认 Bad Request
+    exec("\n".join(lines), namespace)
+    return namespace["_classify"]
+
+
+def _init_exception_maps() -> None:
+    """首次处理领域异常时填充状态码映射和预装箱模板"""
+    global _classify_status
+    from domain.common.exceptions import (
+        EntityNotFoundException,
+        AggregateNotFoundException,
+        BusinessRuleViolationException,
+        DomainValidationException,
+        InvalidOperationException,
+        DuplicateEntityException,
+        AggregateVersionMismatchException,
+        AuthenticationException,
+    )
+
+    EXCEPTION_STATUS_MAP.update({
+        EntityNotFoundException: 404,
+        AggregateNotFoundException: 404,
+        BusinessRuleViolationException: 422,
+        DomainValidationException: 400,
+        InvalidOperationException: 400,
+        DuplicateEntityException: 409,
+        AggregateVersionMismatchException: 409,
+        AuthenticationException: 401,
+    })
+    _ERROR_TEMPLATES.update({
+        exc_type: ApplicationError(code="", message="", status_code=status_code)
+        for exc_type, status_code in EXCEPTION_STATUS_MAP.items()
+    })
+    _classify_status = _compile_status_classifier()
+
+_INTERNAL_ERROR_TEMPLATE = ApplicationError(
+    code="INTERNAL_ERROR",
+    message="An unexpected error occurred",
+    status_code=500,
+)
 
 
 class ExceptionBehavior:
@@ -90,9 +145,6 @@ class ExceptionBehavior:
             request: Command 或 Query 对象
             next_handler: 调用下一个 behavior 或实际 handler 的函数
         """
-        request_id = get_request_id() or "-"
-        request_name = type(request).__name__
-
         try:
             return await next_handler()
 
@@ -102,24 +154,41 @@ class ExceptionBehavior:
 
         except DomainException as e:
             # 领域异常 -> 应用层异常
-            status_code = self._get_status_code(e)
+            # request_id/request_name 只在异常分支需要，成功路径零开销
+            request_id = get_request_id() or "-"
+            request_name = request_type_name(type(request))
 
             logger.warning(
                 f"[{request_id}] {request_name} domain exception: "
                 f"{e.code} - {e.message}"
             )
 
-            raise ApplicationException(
-                ApplicationError(
+            if not EXCEPTION_STATUS_MAP:
+                _init_exception_maps()
+
+            # 直接映射的类型走预装箱模板，只替换可变字段
+            template = _ERROR_TEMPLATES.get(type(e))
+            if template is not None:
+                error = replace(
+                    template,
                     code=e.code,
                     message=e.message,
-                    status_code=status_code,
-                    details=self._extract_details(e)
+                    details=self._extract_details(e),
                 )
-            )
+            else:
+                error = ApplicationError(
+                    code=e.code,
+                    message=e.message,
+                    status_code=self._get_status_code(e),
+                    details=self._extract_details(e),
+                )
+            raise ApplicationException(error)
 
         except Exception as e:
             # 未预期的异常 -> 500 内部错误
+            request_id = get_request_id() or "-"
+            request_name = request_type_name(type(request))
+
             logger.error(
                 f"[{request_id}] {request_name} unexpected exception: "
                 f"{type(e).__name__}: {e}",
@@ -127,51 +196,51 @@ class ExceptionBehavior:
             )
 
             raise ApplicationException(
-                ApplicationError(
-                    code="INTERNAL_ERROR",
-                    message="An unexpected error occurred",
-                    status_code=500,
-                    details={"exception_type": type(e).__name__}
+                replace(
+                    _INTERNAL_ERROR_TEMPLATE,
+                    details={"exception_type": type(e).__name__},
                 )
             )
 
     def _get_status_code(self, exception: DomainException) -> int:
-        """获取异常对应的 HTTP 状态码"""
-        for exc_type, status_code in EXCEPTION_STATUS_MAP.items():
-            if isinstance(exception, exc_type):
-                return status_code
-        return 400  # 默认 Bad Request
-
-    def _extract_details(self, exception: DomainException) -> Dict[str, Any]:
-        """提取异常的详细信息"""
-        details = {}
-
-        # 提取异常的自定义属性
-        for attr in dir(exception):
-            if not attr.startswith("_") and attr not in ("message", "code", "args"):
-                value = getattr(exception, attr, None)
-                if value is not None and not callable(value):
-                    details[attr] = str(value)
-
-        return details
+        """获取异常对应的 HTTP 状态码
 
+        首次见到的类型走 codegen 的 isinstance 梯形分类，结果按
+        具体类型缓存；热错误路径之后是单次哈希查找。
+        """
+        exc_type = type(exception)
+        status_code = _status_cache.get(exc_type)
+        if status_code is None:
+            if _classify_status is None:
+                _init_exception_maps()
+            status_code = _classify_status(exception)
+            _status_cache[exc_type] = status_code
+        return status_code
+
+    def _extract_details(self, exception: DomainException) -> Mapping[str, Any]:
+        """提取异常的详细信息
+
+        首次见到的异常类型用 dir() 反射筛选出自定义属性名并缓存，
+        之后只对缓存的名字做一轮 getattr，跳过整个反射流程。
+        无自定义属性的类型直接返回共享的不可变空映射。
+        """
+        exc_type = type(exception)
+        attrs = _details_attrs_cache.get(exc_type)
+        if attrs is None:
+            attrs = tuple(
+                name for name in dir(exception)
+                if not name.startswith("_")
+                and name not in ("message", "code", "args")
+                and not callable(getattr(exception, name, None))
+            )
+            _details_attrs_cache[exc_type] = attrs
 
-def register_exception_behavior() -> None:
-    """
-    注册异常处理 Behavior 到 mediatr
+        if not attrs:
+            return _EMPTY_DETAILS
 
-    必须在应用启动时调用。
-    ExceptionBehavior 应该在 ValidationBehavior 之后执行。
-    """
-    from typing import Any
-    import mediatr
-
-    if Any not in mediatr.__behaviors__:
-        mediatr.__behaviors__[Any] = []
-
-    # 插入到位置 1（在 ValidationBehavior 之后）
-    if ExceptionBehavior not in mediatr.__behaviors__[Any]:
-        # 找到合适的位置插入
-        insert_pos = 1 if len(mediatr.__behaviors__[Any]) > 0 else 0
-        mediatr.__behaviors__[Any].insert(insert_pos, ExceptionBehavior)
-        logger.debug("ExceptionBehavior registered")
+        details = {}
+        for attr in attrs:
+            value = getattr(exception, attr, None)
+            if value is not None:
+                details[attr] = str(value)
+        return details
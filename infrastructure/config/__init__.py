@@ -2,6 +2,6 @@
 配置管理模块
 """
 
-from .settings import Settings, get_settings, settings
+from .settings import Settings, get_settings
 
-__all__ = ["Settings", "get_settings", "settings"]
+__all__ = ["Settings", "get_settings"]
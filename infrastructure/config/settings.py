@@ -4,7 +4,9 @@
 使用 pydantic-settings 管理环境变量和配置
 """
 
+from functools import lru_cache
 from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -105,22 +107,16 @@ class Settings(BaseSettings):
             return self.prod_database_url
 
 
-# 全局配置实例（单例）
-_settings: Settings | None = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     获取配置实例（单例模式）
 
+    延迟到首次调用才构造，避免 import 时就解析 .env 和环境变量。
+    lru_cache 在 C 层完成单例查找；需要重置时调用
+    ``get_settings.cache_clear()``。
+
     Returns:
         Settings 实例
     """
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
-
-
-# 便捷导出
-settings = get_settings()
+    return Settings()
@@ -22,16 +22,49 @@
         await uow.commit()
 """
 
-from .infrastructure import InfraContainer, get_request_session, set_request_session
-from .application import AppContainer
-from .bootstrap import (
-    Bootstrap,
-    bootstrap,
-    get_bootstrap,
-    get_settings,
-    get_unit_of_work,
-    get_session_factory,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .infrastructure import InfraContainer, get_request_session, set_request_session
+    from .application import AppContainer
+    from .bootstrap import (
+        Bootstrap,
+        bootstrap,
+        get_bootstrap,
+        get_settings,
+        get_unit_of_work,
+        get_session_factory,
+    )
+
+# PEP 562 懒加载：导出名 -> (子模块, 属性)。
+# import infrastructure.containers 本身不再拉起 SQLAlchemy async /
+# dependency-injector 导入链，重模块在首次访问符号时才加载。
+_LAZY = {
+    "InfraContainer": (".infrastructure", "InfraContainer"),
+    "get_request_session": (".infrastructure", "get_request_session"),
+    "set_request_session": (".infrastructure", "set_request_session"),
+    "AppContainer": (".application", "AppContainer"),
+    "Bootstrap": (".bootstrap", "Bootstrap"),
+    "bootstrap": (".bootstrap", "bootstrap"),
+    "get_bootstrap": (".bootstrap", "get_bootstrap"),
+    "get_settings": (".bootstrap", "get_settings"),
+    "get_unit_of_work": (".bootstrap", "get_unit_of_work"),
+    "get_session_factory": (".bootstrap", "get_session_factory"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module_name, __package__), attr)
+    globals()[name] = value  # 缓存，后续访问不再进 __getattr__
+    return value
+
 
 __all__ = [
     # 容器
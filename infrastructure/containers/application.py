@@ -77,3 +77,6 @@ def wire_handlers(container: AppContainer) -> None:
     # 示例：
     # factory.register_handler(YourCommandHandler, container.your_command_handler)
     # factory.register_handler(YourQueryHandler, container.your_query_handler)
+
+    # 注册完成后冻结注册表：dispatch 热路径改走预绑定的闭包管理器
+    factory.freeze()
@@ -15,27 +15,22 @@
     )
 """
 
+from operator import attrgetter
+
 from dependency_injector import containers, providers
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
-from contextvars import ContextVar
 
 from infrastructure.config.settings import Settings
 from infrastructure.persistence.database_factory import DatabaseFactory
 from infrastructure.persistence.unit_of_work import UnitOfWork
 
-
-# 请求级别的 AsyncSession 上下文变量
-_request_session: ContextVar[AsyncSession | None] = ContextVar("request_session", default=None)
-
-
-def get_request_session() -> AsyncSession | None:
-    """获取当前请求的 AsyncSession"""
-    return _request_session.get()
-
-
-def set_request_session(session: AsyncSession | None) -> None:
-    """设置当前请求的 AsyncSession"""
-    _request_session.set(session)
+# 请求级 session 的 ContextVar 统一定义在 infrastructure.context，
+# 此处 re-export 保持原导入路径兼容
+from infrastructure.context import (  # noqa: F401
+    _request_session,
+    get_request_session,
+    set_request_session,
+)
 
 
 class InfraContainer(containers.DeclarativeContainer):
@@ -47,20 +42,12 @@ class InfraContainer(containers.DeclarativeContainer):
     settings = providers.Singleton(Settings)
 
     # 便捷访问常用配置
-    app_env = providers.Callable(
-        lambda s: s.app_env,
-        s=settings
-    )
+    # attrgetter 为 C 实现，解析时不经过 Python lambda 帧
+    app_env = providers.Callable(attrgetter("app_env"), settings)
 
-    database_url = providers.Callable(
-        lambda s: s.database_url,
-        s=settings
-    )
+    database_url = providers.Callable(attrgetter("database_url"), settings)
 
-    debug = providers.Callable(
-        lambda s: s.debug,
-        s=settings
-    )
+    debug = providers.Callable(attrgetter("debug"), settings)
 
     # ============ 异步数据库 ============
 
@@ -0,0 +1,29 @@
+"""
+请求上下文
+
+请求级别的 ContextVar 统一定义在此模块，避免在多个容器模块中
+各自维护副本导致读写不同步。模块本身不依赖 SQLAlchemy 运行时
+导入，行为层可以轻量引用。
+"""
+
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# 请求级别的 AsyncSession 上下文变量（全局唯一）
+_request_session: ContextVar[Optional["AsyncSession"]] = ContextVar(
+    "request_session", default=None
+)
+
+
+def get_request_session() -> Optional["AsyncSession"]:
+    """获取当前请求的 AsyncSession"""
+    return _request_session.get()
+
+
+def set_request_session(session: Optional["AsyncSession"]) -> None:
+    """设置当前请求的 AsyncSession"""
+    _request_session.set(session)
@@ -6,14 +6,31 @@
 
 from .event_bus import (
     get_event_emitter,
-    event_emitter,
     on_event,
-    emit,
+    dispatch,
+    serialize_event,
+    set_event_serializer,
 )
 
+
+def __getattr__(name: str):
+    # event_emitter / emit 懒物化（见 event_bus.__getattr__），
+    # 包导入不触发发射器构造
+    if name in ("event_emitter", "emit"):
+        from . import event_bus
+
+        value = getattr(event_bus, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "get_event_emitter",
     "event_emitter",
     "on_event",
     "emit",
+    "dispatch",
+    "serialize_event",
+    "set_event_serializer",
 ]
@@ -21,6 +21,25 @@
     set_log_backend("logfire")
 """
 
-from .logger_factory import get_logger, set_log_backend, LogBackend
+from .logger_factory import (
+    get_logger,
+    is_debug_enabled,
+    is_error_enabled,
+    is_info_enabled,
+    set_log_backend,
+    set_log_name,
+    LogBackend,
+)
+from .async_sink import AsyncLogSink, log_sink
 
-__all__ = ["get_logger", "set_log_backend", "LogBackend"]
+__all__ = [
+    "get_logger",
+    "is_debug_enabled",
+    "is_error_enabled",
+    "is_info_enabled",
+    "set_log_backend",
+    "set_log_name",
+    "LogBackend",
+    "AsyncLogSink",
+    "log_sink",
+]
@@ -0,0 +1,94 @@
+"""
+异步批量日志 Sink
+
+事件处理器中逐条 print(...) 会对每条记录各做一次 stdout 加锁 + flush；
+多个处理器同时触发时就是多次串行的内核写。此模块提供一个基于
+asyncio.Queue 的 Sink：生产方只入队，单个后台任务批量取出并用
+writelines 一次写出（一批最多 max_batch 条，一次 flush）。
+
+使用方式：
+    from infrastructure.logging.async_sink import AsyncLogSink
+
+    sink = AsyncLogSink()
+    sink.start()  # 在运行中的事件循环里调用
+
+    @on_event(UserCreatedEvent)
+    async def log_user_creation(event):
+        await sink.put(f"User created: {event.aggregate_id}")
+
+    ...
+    await sink.stop()  # 关闭前冲刷剩余记录
+"""
+
+import asyncio
+import sys
+from typing import Optional, TextIO
+
+
+class AsyncLogSink:
+    """队列缓冲、单消费者批量写出的日志 Sink"""
+
+    def __init__(self, max_batch: int = 64, stream: Optional[TextIO] = None):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._max_batch = max_batch
+        self._stream = stream if stream is not None else sys.stdout
+        self._task: Optional[asyncio.Task] = None
+
+    async def put(self, line: str) -> None:
+        """入队一条日志记录（自动补换行）"""
+        if not line.endswith("\n"):
+            line += "\n"
+        await self._queue.put(line)
+
+    def put_nowait(self, line: str) -> None:
+        """非阻塞入队（同步处理器可用）"""
+        if not line.endswith("\n"):
+            line += "\n"
+        self._queue.put_nowait(line)
+
+    def start(self) -> None:
+        """启动后台批量写出任务（需在运行中的事件循环内调用，幂等）"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def stop(self) -> None:
+        """停止后台任务并冲刷剩余记录"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """同步写出队列中剩余的记录"""
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        if batch:
+            self._stream.writelines(batch)
+            self._stream.flush()
+
+    async def _drain(self) -> None:
+        """后台循环：阻塞取首条，贪婪凑批，一次 writelines + flush"""
+        queue = self._queue
+        max_batch = self._max_batch
+        stream = self._stream
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < max_batch:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            stream.writelines(batch)
+            stream.flush()
+
+
+# 共享的默认 Sink（事件处理器可直接使用）
+log_sink = AsyncLogSink()
@@ -12,7 +12,9 @@ Handler 层日志 Behavior
 import time
 from typing import Any, Callable, Awaitable
 
-from infrastructure.logging import get_logger
+import mediatr
+
+from infrastructure.logging import get_logger, is_error_enabled, is_info_enabled
 from interfaces.api.middleware.logging_middleware import get_request_id
 
 logger = get_logger(__name__)
@@ -38,40 +40,52 @@ class LoggingBehavior:
             request: Command 或 Query 对象
             next_handler: 调用下一个 behavior 或实际 handler 的函数
         """
+        # 两个级别都关闭时整个 behavior 是零开销直通：
+        # 不取名字、不读 ContextVar、不计时
+        info_enabled = is_info_enabled()
+        if not info_enabled and not is_error_enabled():
+            return await next_handler()
+
         request_name = type(request).__name__
         request_id = get_request_id() or "-"
-        start = time.perf_counter()
+        # monotonic_ns + 整数除法，避免浮点乘法和 perf_counter 的换算
+        start = time.monotonic_ns()
 
-        logger.info(f"[{request_id}] >> {request_name} executing...")
+        if info_enabled:
+            logger.info(f"[{request_id}] >> {request_name} executing...")
 
         try:
             result = await next_handler()
 
-            duration_ms = (time.perf_counter() - start) * 1000
-            logger.info(f"[{request_id}] << {request_name} completed {duration_ms:.0f}ms")
+            if info_enabled:
+                duration_ms = (time.monotonic_ns() - start) // 1_000_000
+                logger.info(f"[{request_id}] << {request_name} completed {duration_ms}ms")
 
             return result
 
         except Exception as e:
-            duration_ms = (time.perf_counter() - start) * 1000
-            logger.error(f"[{request_id}] << {request_name} failed: {type(e).__name__}: {e} {duration_ms:.0f}ms")
+            duration_ms = (time.monotonic_ns() - start) // 1_000_000
+            logger.error(f"[{request_id}] << {request_name} failed: {type(e).__name__}: {e} {duration_ms}ms")
             raise
 
 
+# 幂等标志：重复调用 register_logging_behavior 时 O(1) 早退，
+# 不再对 behavior 列表做线性成员扫描
+_registered = False
+
+
 def register_logging_behavior() -> None:
     """
-    注册日志 Behavior 到 mediatr
+    注册日志 Behavior 到 mediatr（幂等）
 
     必须在应用启动时调用，且在注册 handler 之前。
     """
-    from typing import Any
-    import mediatr
+    global _registered
+    if _registered:
+        return
 
     # 注册为全局 behavior（适用于所有 Command/Query）
-    if Any not in mediatr.__behaviors__:
-        mediatr.__behaviors__[Any] = []
-
-    # 避免重复注册
-    if LoggingBehavior not in mediatr.__behaviors__[Any]:
-        mediatr.__behaviors__[Any].insert(0, LoggingBehavior)
-        logger.debug("LoggingBehavior registered")
+    behaviors = mediatr.__behaviors__.setdefault(Any, [])
+    behaviors.insert(0, LoggingBehavior)
+    _registered = True
+    logger.debug("LoggingBehavior registered")
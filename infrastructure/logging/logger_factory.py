@@ -10,10 +10,69 @@
 
 import os
 import sys
+from contextvars import ContextVar
 from typing import Literal, Any
 
 LogBackend = Literal["loguru", "logfire"]
 
+# Loguru handler 只需配置一次（模块级标志，避免每次 get_logger 都走类属性检查）
+_loguru_configured = False
+
+# 请求作用域的日志名称：代替每模块 bind(name=...) 的代理对象分配。
+# 输出格式中的 {name} 本就是调用点模块名，此 contextvar 仅在需要
+# 覆盖名称（如请求级标签）时通过 set_log_name 设置。
+_log_name_var: ContextVar[str] = ContextVar("log_name", default="")
+
+
+def _patch_log_name(record) -> None:
+    """Loguru patcher：用 contextvar 中的名称覆盖 record["name"]
+
+    直接写 record["name"]：输出格式里的 {name} 读的就是它，
+    extra 里的同名键不会被 {name} 占位符使用。
+    """
+    name = _log_name_var.get()
+    if name:
+        record["name"] = name
+
+
+def set_log_name(name: str):
+    """设置当前上下文的日志名称，返回可用于恢复的 Token"""
+    return _log_name_var.set(name)
+
+
+def _setup_loguru_once() -> None:
+    """一次性配置 Loguru handler（幂等）"""
+    global _loguru_configured
+    if _loguru_configured:
+        return
+
+    from loguru import logger
+
+    # 移除默认 handler
+    logger.remove()
+
+    # 添加自定义 handler
+    logger.add(
+        sys.stderr,
+        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        level=os.getenv("LOG_LEVEL", "INFO"),
+    )
+
+    # 可选：添加文件 handler
+    log_file = os.getenv("LOG_FILE")
+    if log_file:
+        logger.add(
+            log_file,
+            rotation="500 MB",
+            retention="10 days",
+            level=os.getenv("LOG_LEVEL", "INFO"),
+        )
+
+    # 通过 patcher 注入请求作用域名称（仅当 contextvar 被设置时）
+    logger.configure(patcher=_patch_log_name)
+
+    _loguru_configured = True
+
 
 class LoggerFactory:
     """日志工厂"""
@@ -61,8 +120,10 @@ class LoggerFactory:
     @classmethod
     def set_backend(cls, backend: LogBackend):
         """设置日志后端"""
+        global _loguru_configured
         cls._backend = backend
         cls._initialized = False
+        _loguru_configured = False
 
     @classmethod
     def get_logger(cls, name: str) -> Any:
@@ -84,40 +145,20 @@ class LoggerFactory:
 
     @classmethod
     def _get_loguru_logger(cls, name: str):
-        """获取 Loguru 日志器"""
+        """获取 Loguru 日志器（返回共享单例，不再按模块 bind）"""
         try:
-            from loguru import logger
+            _setup_loguru_once()
         except ImportError:
             raise ImportError(
                 "Loguru is required but not installed. "
                 "Install it with: pip install loguru"
             )
 
-        if not cls._initialized:
-            # 移除默认 handler
-            logger.remove()
-
-            # 添加自定义 handler
-            logger.add(
-                sys.stderr,
-                format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-                level=os.getenv("LOG_LEVEL", "INFO"),
-            )
-
-            # 可选：添加文件 handler
-            log_file = os.getenv("LOG_FILE")
-            if log_file:
-                logger.add(
-                    log_file,
-                    rotation="500 MB",
-                    retention="10 days",
-                    level=os.getenv("LOG_LEVEL", "INFO"),
-                )
+        # Loguru 是全局的；输出格式中的 {name} 取自调用点，
+        # 直接返回共享实例即可，无需每个模块分配 bind 代理
+        from loguru import logger
 
-            cls._initialized = True
-
-        # Loguru 是全局的，但可以绑定上下文
-        return logger.bind(name=name)
+        return logger
 
     @classmethod
     def _get_logfire_logger(cls, name: str):
@@ -164,6 +205,38 @@ class LoggerFactory:
 
 # 便捷函数
 
+def _level_enabled(level_no: int) -> bool:
+    """指定级别是否会被任何 handler 输出
+
+    Loguru 没有 isEnabledFor，这里读取其最低生效级别。
+    """
+    from loguru import logger
+
+    core = getattr(logger, "_core", None)
+    if core is None:
+        return True  # 未知后端，保守地认为开启
+    return core.min_level <= level_no
+
+
+def is_debug_enabled() -> bool:
+    """DEBUG 级别是否会被输出
+
+    热路径（如仓储日志）在构建日志参数前先调用此函数，
+    DEBUG 关闭时完全跳过 request_id 读取和字符串格式化。
+    """
+    return _level_enabled(10)
+
+
+def is_info_enabled() -> bool:
+    """INFO 级别是否会被输出"""
+    return _level_enabled(20)
+
+
+def is_error_enabled() -> bool:
+    """ERROR 级别是否会被输出"""
+    return _level_enabled(40)
+
+
 def get_logger(name: str = __name__) -> Any:
     """
     获取日志器（便捷函数）
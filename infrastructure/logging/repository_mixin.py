@@ -14,16 +14,64 @@ Repository 层日志 Mixin
         pass  # 自动有日志
 """
 
-from typing import Any, Optional, List, TypeVar
+from typing import Any, Callable, Optional, List, TypeVar
 from functools import cached_property
 
-from infrastructure.logging import get_logger
+from infrastructure.logging import get_logger, is_debug_enabled
 from interfaces.api.middleware.logging_middleware import get_request_id
 
 TEntity = TypeVar("TEntity")
 TId = TypeVar("TId")
 
 
+def _entity_desc(entity: Any) -> str:
+    """实体描述：类型名[id]"""
+    return f"{type(entity).__name__}[{getattr(entity, 'id', '?')}]"
+
+
+def _spec_desc(specification: Any = None) -> str:
+    """Specification 描述"""
+    return f"spec={type(specification).__name__ if specification else 'None'}"
+
+
+def _id_desc(entity_id: Any) -> str:
+    """实体 ID 描述（参数名与 BaseRepository.get_by_id 一致，支持关键字调用）"""
+    return str(entity_id)
+
+
+def _traced(
+    method_name: str,
+    describe: Callable[..., str],
+    describe_result: Callable[[Any], str],
+):
+    """生成一个带日志的方法包装器
+
+    四个 CRUD 包装器的"记录 -> await super() -> 记录"骨架完全
+    相同，只有参数/结果的描述方式不同；统一从此工厂生成，
+    DEBUG 关闭时单次级别检查后直通 super()。
+    """
+
+    async def wrapper(self, *args, **kwargs):
+        sup = getattr(super(LoggingRepositoryMixin, self), method_name)
+        if not is_debug_enabled():
+            return await sup(*args, **kwargs)
+
+        prefix = self._log_prefix()
+        call = f"{method_name}({describe(*args, **kwargs)})"
+        log = self._repo_logger
+        log.debug(f"{prefix} {call}")
+
+        result = await sup(*args, **kwargs)
+
+        log.debug(f"{prefix} {call} -> {describe_result(result)}")
+        return result
+
+    wrapper.__name__ = method_name
+    wrapper.__qualname__ = f"LoggingRepositoryMixin.{method_name}"
+    wrapper.__doc__ = f"{method_name}（带日志）"
+    return wrapper
+
+
 class LoggingRepositoryMixin:
     """
     Repository 日志混入
@@ -31,7 +79,9 @@ class LoggingRepositoryMixin:
     为 Repository 实现提供自动日志记录能力。
     继承时放在第一位（MRO 顺序）。
 
-    日志级别为 DEBUG，生产环境可通过配置关闭。
+    日志级别为 DEBUG，生产环境可通过配置关闭；关闭时每个
+    方法只付出一次级别检查，不读 request_id、不格式化字符串。
+    CRUD 包装器由 _traced 工厂统一生成，见下方方法表。
     """
 
     @cached_property
@@ -44,51 +94,21 @@ class LoggingRepositoryMixin:
         request_id = get_request_id() or "-"
         return f"[{request_id}]"
 
-    async def add(self, entity: TEntity) -> None:
-        """添加实体（带日志）"""
-        prefix = self._log_prefix()
-        entity_name = type(entity).__name__
-        entity_id = getattr(entity, "id", "?")
-        self._repo_logger.debug(f"{prefix} add({entity_name}[{entity_id}])")
-
-        result = await super().add(entity)
-
-        self._repo_logger.debug(f"{prefix} add({entity_name}[{entity_id}]) -> done")
-        return result
-
-    async def get_by_id(self, entity_id: TId) -> Optional[TEntity]:
-        """根据 ID 获取实体（带日志）"""
-        prefix = self._log_prefix()
-        self._repo_logger.debug(f"{prefix} get_by_id({entity_id})")
-
-        result = await super().get_by_id(entity_id)
-
-        if result:
-            self._repo_logger.debug(f"{prefix} get_by_id({entity_id}) -> found")
-        else:
-            self._repo_logger.debug(f"{prefix} get_by_id({entity_id}) -> not found")
+    # 方法名 -> (参数描述, 结果描述)；包装器在类体外统一生成
+    add: Callable[..., Any]
+    get_by_id: Callable[..., Any]
+    remove: Callable[..., Any]
+    list: Callable[..., Any]
 
-        return result
-
-    async def remove(self, entity: TEntity) -> None:
-        """移除实体（带日志）"""
-        prefix = self._log_prefix()
-        entity_name = type(entity).__name__
-        entity_id = getattr(entity, "id", "?")
-        self._repo_logger.debug(f"{prefix} remove({entity_name}[{entity_id}])")
-
-        result = await super().remove(entity)
 
-        self._repo_logger.debug(f"{prefix} remove({entity_name}[{entity_id}]) -> done")
-        return result
-
-    async def list(self, specification: Optional[Any] = None) -> List[TEntity]:
-        """列表查询（带日志）"""
-        prefix = self._log_prefix()
-        spec_name = type(specification).__name__ if specification else "None"
-        self._repo_logger.debug(f"{prefix} list(spec={spec_name})")
+_TRACED_METHODS = (
+    ("add", _entity_desc, lambda result: "done"),
+    ("get_by_id", _id_desc, lambda result: "found" if result else "not found"),
+    ("remove", _entity_desc, lambda result: "done"),
+    ("list", _spec_desc, lambda result: f"{len(result)} items"),
+)
 
-        result = await super().list(specification)
+for _name, _describe, _describe_result in _TRACED_METHODS:
+    setattr(LoggingRepositoryMixin, _name, _traced(_name, _describe, _describe_result))
 
-        self._repo_logger.debug(f"{prefix} list(spec={spec_name}) -> {len(result)} items")
-        return result
+del _name, _describe, _describe_result
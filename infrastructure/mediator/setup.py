@@ -38,6 +38,7 @@ Mediator 配置与工厂
 """
 
 from typing import Type, Any, Dict, Optional, Callable
+from dependency_injector import providers as di_providers
 from mediatr import Mediator
 
 from infrastructure.behaviors import register_all_behaviors
@@ -55,35 +56,82 @@ class MediatorFactory:
     def __init__(self):
         # Handler 类 -> Provider 的映射
         self._handler_providers: Dict[Type, Callable[[], Any]] = {}
-
-    def register_handler(self, handler_class: Type, provider: Callable[[], Any]) -> None:
+        # Singleton 作用域在注册时预解析出的实例（部分求值 DI 图）
+        self._handler_instances: Dict[Type, Any] = {}
+
+    def register_handler(
+        self,
+        handler_class: Type,
+        provider: Callable[[], Any],
+        scope: str = "factory",
+    ) -> None:
         """
         注册 Handler 的 Provider
 
+        Singleton 作用域（显式 scope="singleton" 或 Provider 本身是
+        providers.Singleton）在注册时即解析为实例：dispatch 热路径
+        只做一次字典查找，不再重建 Handler 及其传递依赖。
+
         Args:
             handler_class: Handler 类
             provider: 返回 Handler 实例的 Provider（来自容器）
+            scope: "factory"（默认，每次 dispatch 新实例）或
+                "singleton"（无状态 Handler，注册时解析并复用）
         """
+        if scope not in ("factory", "singleton"):
+            raise ValueError(f"Unknown handler scope: {scope}")
         self._handler_providers[handler_class] = provider
+        if scope == "singleton" or isinstance(provider, di_providers.Singleton):
+            self._handler_instances[handler_class] = provider()
 
     def register_handlers(self, handlers: Dict[Type, Callable[[], Any]]) -> None:
         """批量注册 Handlers"""
-        self._handler_providers.update(handlers)
+        for handler_class, provider in handlers.items():
+            self.register_handler(handler_class, provider)
 
     def _handler_class_manager(self, handler_class: Type, is_behavior: bool = False) -> Any:
         """
         Handler 类管理器 - 供 Mediator 使用
 
         当 Mediator 需要实例化 Handler 时调用此函数。
-        优先从注册的 Provider 获取，否则直接实例化（无依赖的 Handler）。
+        优先返回预解析的 Singleton 实例，其次从注册的 Provider 获取，
+        否则直接实例化（无依赖的 Handler）。
         """
-        if handler_class in self._handler_providers:
+        instance = self._handler_instances.get(handler_class)
+        if instance is not None:
+            return instance
+        provider = self._handler_providers.get(handler_class)
+        if provider is not None:
             # 从容器获取（依赖会被注入）
-            return self._handler_providers[handler_class]()
-        else:
-            # 直接实例化（无依赖的简单 Handler 或函数式 Handler）
+            return provider()
+        # 直接实例化（无依赖的简单 Handler 或函数式 Handler）
+        return handler_class()
+
+    def freeze(self) -> None:
+        """冻结注册表（启动期全部 Handler 注册完成后调用）
+
+        Provider 映射换成 MappingProxyType 防止后续改动，
+        并把 _handler_class_manager 重绑为闭包：字典的 get 方法
+        作为默认参数预绑定为局部变量，dispatch 热路径不再有
+        self 属性查找。之后创建的 Mediator 使用冻结版管理器。
+        """
+        from types import MappingProxyType
+
+        self._handler_providers = MappingProxyType(dict(self._handler_providers))
+        instances_get = self._handler_instances.get
+        providers_get = self._handler_providers.get
+
+        def _frozen_manager(handler_class: Type, is_behavior: bool = False) -> Any:
+            instance = instances_get(handler_class)
+            if instance is not None:
+                return instance
+            provider = providers_get(handler_class)
+            if provider is not None:
+                return provider()
             return handler_class()
 
+        self._handler_class_manager = _frozen_manager
+
     def create_mediator(self) -> Mediator:
         """创建 Mediator 实例"""
         return Mediator(handler_class_manager=self._handler_class_manager)
@@ -111,6 +159,10 @@ def create_mediator() -> Mediator:
     return get_mediator_factory().create_mediator()
 
 
-def register_handler(handler_class: Type, provider: Callable[[], Any]) -> None:
+def register_handler(
+    handler_class: Type,
+    provider: Callable[[], Any],
+    scope: str = "factory",
+) -> None:
     """注册 Handler（便捷函数）"""
-    get_mediator_factory().register_handler(handler_class, provider)
+    get_mediator_factory().register_handler(handler_class, provider, scope)
@@ -6,7 +6,9 @@
 
 from .database_factory import (
     DatabaseFactory,
+    dispose_engines,
     get_engine,
+    get_scoped_session,
     get_session_factory,
     init_database,
 )
@@ -14,7 +16,9 @@ from .unit_of_work import UnitOfWork, unit_of_work
 
 __all__ = [
     "DatabaseFactory",
+    "dispose_engines",
     "get_engine",
+    "get_scoped_session",
     "get_session_factory",
     "init_database",
     "UnitOfWork",
@@ -119,20 +119,42 @@ def run_migrations_online() -> None:
     configuration = config.get_section(config.config_ini_section, {})
     configuration["sqlalchemy.url"] = get_database_url()
 
-    connectable = engine_from_config(
-        configuration,
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    sqlite = is_sqlite()
+
+    if sqlite:
+        # SQLite：StaticPool 让整个迁移过程复用一条连接，
+        # 避免 NullPool 每次 checkout 都重新打开数据库文件
+        connectable = engine_from_config(
+            configuration,
+            prefix="sqlalchemy.",
+            poolclass=pool.StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+    else:
+        # PostgreSQL：迁移是一次性操作，保持 NullPool 不留连接
+        connectable = engine_from_config(
+            configuration,
+            prefix="sqlalchemy.",
+            poolclass=pool.NullPool,
+        )
 
     with connectable.connect() as connection:
+        if sqlite:
+            # 一次性设好 PRAGMA，后续所有迁移语句都受益
+            connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+            connection.exec_driver_sql("PRAGMA synchronous=NORMAL")
+            connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+            connection.exec_driver_sql("PRAGMA temp_store=MEMORY")
+
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
             # SQLite 需要 batch 模式（不支持 ALTER TABLE）
-            render_as_batch=is_sqlite(),
+            render_as_batch=sqlite,
             # 检测列类型变化
             compare_type=True,
+            # 每个迁移版本独立事务，避免大迁移集堆成一个巨型事务
+            transaction_per_migration=True,
             # 检测服务器默认值变化（可选，可能产生噪音）
             # compare_server_default=True,
         )
@@ -15,66 +15,109 @@ class UnitOfWork:
     """
     异步工作单元 - AsyncSession 实现
 
+    __slots__ + 直接属性：uow.session 是普通槽位读取，
+    没有 __dict__ 查找，也没有 property 描述符调用。
+    未进入上下文时 session 为 None。
+
+    支持复用已有 Session（如中间件创建的请求级 Session）：
+    传入 existing_session 时不再新建 AsyncSession，而是在其上
+    开 SAVEPOINT（begin_nested），退出时释放/回滚保存点而不关闭
+    Session。这样省去每次事务的 identity-map 和连接 checkout 开销，
+    也让单个请求内的多个聚合操作共享同一条连接。
+
     用法：
         async with UnitOfWork(session_factory) as uow:
             # 执行业务逻辑
             user = User(name="test")
             uow.session.add(user)
             await uow.commit()  # 提交事务
+
+        # 复用请求级 Session（SAVEPOINT 模式）：
+        from infrastructure.context import get_request_session
+        async with UnitOfWork(session_factory, existing_session=get_request_session()) as uow:
+            uow.session.add(user)
+            await uow.commit()  # 仅释放保存点，外层事务由中间件提交
     """
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+    __slots__ = ("_session_factory", "session", "_existing", "_savepoint")
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        existing_session: Optional[AsyncSession] = None,
+    ):
         """
         初始化工作单元
 
         Args:
             session_factory: 返回 AsyncSession 的工厂
+            existing_session: 已在途的 Session（可选）；提供时
+                在其上开 SAVEPOINT 而不是新建 Session
         """
         self._session_factory = session_factory
-        self._session: Optional[AsyncSession] = None
+        self._existing = existing_session
+        self._savepoint = None
+        self.session: Optional[AsyncSession] = None
 
     async def __aenter__(self):
         """进入异步上下文管理器"""
-        self._session = self._session_factory()
+        if self._existing is not None:
+            # SAVEPOINT 模式：复用在途 Session
+            self.session = self._existing
+            self._savepoint = await self._existing.begin_nested()
+        else:
+            self.session = self._session_factory()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """退出异步上下文管理器"""
+        savepoint = self._savepoint
+        if savepoint is not None:
+            # SAVEPOINT 模式：只处理保存点，不关闭外部 Session
+            self._savepoint = None
+            if savepoint.is_active:
+                if exc_type is not None:
+                    await savepoint.rollback()
+                else:
+                    await savepoint.commit()
+            self.session = None
+            return
+
         if exc_type is not None:
             # 发生异常，回滚
             await self.rollback()
 
         # 关闭 session
-        if self._session:
-            await self._session.close()
-            self._session = None
-
-    @property
-    def session(self) -> AsyncSession:
-        """获取当前 Session"""
-        if self._session is None:
-            raise RuntimeError("UnitOfWork not started. Use 'async with UnitOfWork() as uow'")
-        return self._session
+        session = self.session
+        if session:
+            await session.close()
+            self.session = None
 
     async def commit(self):
-        """提交事务"""
-        if self._session:
-            await self._session.commit()
+        """提交事务（SAVEPOINT 模式下仅释放保存点）"""
+        savepoint = self._savepoint
+        if savepoint is not None and savepoint.is_active:
+            await savepoint.commit()
+        elif self.session:
+            await self.session.commit()
 
     async def rollback(self):
-        """回滚事务"""
-        if self._session:
-            await self._session.rollback()
+        """回滚事务（SAVEPOINT 模式下仅回滚到保存点）"""
+        savepoint = self._savepoint
+        if savepoint is not None and savepoint.is_active:
+            await savepoint.rollback()
+        elif self.session:
+            await self.session.rollback()
 
     async def flush(self):
         """刷新到数据库（不提交）"""
-        if self._session:
-            await self._session.flush()
+        if self.session:
+            await self.session.flush()
 
     async def refresh(self, instance):
         """刷新对象状态"""
-        if self._session:
-            await self._session.refresh(instance)
+        if self.session:
+            await self.session.refresh(instance)
 
 
 @asynccontextmanager
@@ -31,20 +31,17 @@ App - DDD 框架的 API 入口
     app.run()
 """
 
-from typing import Optional, Callable, Set
+from typing import TYPE_CHECKING, Optional, Callable, Set
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from fastmcp import FastMCP
 
 from infrastructure.containers.bootstrap import bootstrap, Bootstrap
 from infrastructure.config.settings import get_settings
 from infrastructure.persistence.database_factory import init_database
-from interfaces.api.middleware.api_key_middleware import APIKeyMiddleware
-from interfaces.api.middleware.db_session_middleware import DBSessionMiddleware
-from interfaces.api.middleware.logging_middleware import LoggingMiddleware
-from interfaces.api.routes import health_router
-from interfaces.api.exception_handlers import register_exception_handlers
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
 
 class App:
@@ -70,26 +67,27 @@ class App:
         self.enable_api_key_auth = enable_api_key_auth
         self.api_key_whitelist_paths = api_key_whitelist_paths
 
-        # 初始化 Bootstrap（DDD 容器）
-        self._bootstrap: Optional[Bootstrap] = None
+        # 预热 DI 容器：构造时一次性完成全部 wiring 并解析
+        # 常驻单例（mediator、session factory），首个请求不再
+        # 付容器装配成本（p99 冷启动尖峰前移到进程启动）
+        self._bootstrap: Bootstrap = bootstrap()
+        self.bootstrap: Bootstrap = self._bootstrap
+        self.mediator = self._bootstrap.app().mediator()
+        self._session_factory = self._bootstrap.infra.db_session_factory()
 
-        # 创建 FastMCP
-        self._mcp = FastMCP(title)
+        # 配置快照：构造时物化一次，后续挂中间件/路由不再走 DI 解析
+        self._settings = get_settings()
 
-        # 创建 FastAPI（稍后在 lifespan 中初始化）
-        self._fastapi: Optional[FastAPI] = None
+        # FastMCP 延迟创建：fastmcp 导入成本高，
+        # 纯 REST/测试场景不必在构造时付这笔钱
+        self._mcp: Optional["FastMCP"] = None
 
-    @property
-    def bootstrap(self) -> Bootstrap:
-        """获取 Bootstrap 容器"""
-        if self._bootstrap is None:
-            self._bootstrap = bootstrap()
-        return self._bootstrap
+        # MCP ASGI 应用缓存：http_app() 每次都构造新的 Starlette 应用，
+        # dev reload 场景按 worker 重复付这笔钱
+        self._mcp_app = None
 
-    @property
-    def mediator(self):
-        """获取 Mediator 实例"""
-        return self.bootstrap.app().mediator()
+        # 创建 FastAPI（稍后在 lifespan 中初始化）
+        self._fastapi: Optional[FastAPI] = None
 
     @property
     def fastapi(self) -> FastAPI:
@@ -99,19 +97,33 @@ class App:
         return self._fastapi
 
     @property
-    def mcp(self) -> FastMCP:
-        """获取 FastMCP 实例"""
+    def mcp(self) -> "FastMCP":
+        """获取 FastMCP 实例（首次访问时导入并创建）"""
+        if self._mcp is None:
+            from fastmcp import FastMCP
+
+            self._mcp = FastMCP(self.title)
         return self._mcp
 
     def _create_fastapi(self) -> FastAPI:
         """创建 FastAPI 实例并挂载 MCP"""
-        # 获取 MCP ASGI 应用
-        mcp_app = self._mcp.http_app(path=self.mcp_path)
+        # 接口层组件按需导入：import interfaces.api.app 本身保持轻量
+        from interfaces.api.middleware.api_key_middleware import APIKeyMiddleware
+        from interfaces.api.middleware.db_session_middleware import DBSessionMiddleware
+        from interfaces.api.middleware.logging_middleware import LoggingMiddleware
+        from interfaces.api.middleware.mediator_middleware import MediatorMiddleware
+        from interfaces.api.routes import health_router
+        from interfaces.api.exception_handlers import register_exception_handlers
+        from interfaces.api.responses import DefaultJSONResponse
+
+        # 获取 MCP ASGI 应用（缓存，重复构建 FastAPI 时复用）
+        if self._mcp_app is None:
+            self._mcp_app = self.mcp.http_app(path=self.mcp_path)
+        mcp_app = self._mcp_app
 
         @asynccontextmanager
         async def lifespan(app: FastAPI):
-            # 初始化 Bootstrap
-            self._bootstrap = bootstrap()
+            # Bootstrap 已在 __init__ 中预热完成
 
             # 初始化数据库（如果有模型的话）
             # 使用示例：
@@ -128,19 +140,22 @@ class App:
             description=self.description,
             version=self.version,
             lifespan=lifespan,
+            default_response_class=DefaultJSONResponse,
         )
 
         # 添加数据库 Session 中间件（最内层，最先执行）
         # 确保每个请求有独立的 Session，结束时关闭
-        session_factory = self._bootstrap.infra.db_session_factory()
-        app.add_middleware(DBSessionMiddleware, session_factory=session_factory)
+        app.add_middleware(DBSessionMiddleware, session_factory=self._session_factory)
+
+        # 注入 Mediator 到 request.state（处理器直接属性访问，
+        # 不再经过 Depends 的依赖图解析）
+        app.add_middleware(MediatorMiddleware, mediator_getter=lambda: self.mediator)
 
         # 添加 API Key 认证中间件（保护所有路由包括 /tools）
         if self.enable_api_key_auth:
-            settings = get_settings()
             app.add_middleware(
                 APIKeyMiddleware,
-                api_key=settings.api_key,
+                api_key=self._settings.api_key,
                 whitelist_paths=self.api_key_whitelist_paths,
             )
 
@@ -193,7 +208,7 @@ class App:
                 '''工具描述'''
                 return {"result": param}
         """
-        return self._mcp.tool(func, **kwargs) if func else self._mcp.tool(**kwargs)
+        return self.mcp.tool(func, **kwargs) if func else self.mcp.tool(**kwargs)
 
     def mcp_resource(self, uri: str, **kwargs):
         """
@@ -204,7 +219,7 @@ class App:
             def get_version():
                 return "1.0.0"
         """
-        return self._mcp.resource(uri, **kwargs)
+        return self.mcp.resource(uri, **kwargs)
 
     def mcp_prompt(self, func: Optional[Callable] = None, **kwargs):
         """
@@ -216,7 +231,7 @@ class App:
                 '''生成摘要提示'''
                 return f"请总结以下内容：{text}"
         """
-        return self._mcp.prompt(func, **kwargs) if func else self._mcp.prompt(**kwargs)
+        return self.mcp.prompt(func, **kwargs) if func else self.mcp.prompt(**kwargs)
 
     # ============ 运行 ============
 
@@ -236,6 +251,11 @@ class App:
         """获取 ASGI 应用（用于部署）"""
         return self.fastapi
 
+    def reset_asgi_cache(self) -> None:
+        """清空 FastAPI / MCP ASGI 缓存（测试用）"""
+        self._fastapi = None
+        self._mcp_app = None
+
 
 def create_app(
     title: str = "DDD Service",
@@ -12,28 +12,39 @@ from mediatr import Mediator
 
 _mediator_getter: Optional[Callable[[], Mediator]] = None
 
+# 首次解析后的缓存：Mediator 在容器里是单例，
+# 没必要每个请求都走一遍 DI provider 调用链
+_mediator: Optional[Mediator] = None
+
 
 def set_mediator_getter(getter: Callable[[], Mediator]) -> None:
     """
     设置 Mediator 获取器（由 DI 容器调用）
 
     在应用启动时配置，将 DI 容器的 mediator provider 注入。
+    重新配置会使已缓存的实例失效。
     """
-    global _mediator_getter
+    global _mediator_getter, _mediator
     _mediator_getter = getter
+    _mediator = None
 
 
 def get_mediator() -> Mediator:
     """
     获取 Mediator 实例（FastAPI 依赖）
 
+    首次调用通过 getter 解析并缓存，后续调用只读模块变量。
+
     用法：
         @router.post("/accounts")
         async def create(cmd: CreateCmd, mediator: Mediator = Depends(get_mediator)):
             return await mediator.send_async(cmd)
     """
-    if _mediator_getter is None:
-        raise RuntimeError(
-            "Mediator not configured. Call set_mediator_getter() at startup."
-        )
-    return _mediator_getter()
+    global _mediator
+    if _mediator is None:
+        if _mediator_getter is None:
+            raise RuntimeError(
+                "Mediator not configured. Call set_mediator_getter() at startup."
+            )
+        _mediator = _mediator_getter()
+    return _mediator
@@ -13,20 +13,35 @@ API 异常处理器
 }
 """
 
+from typing import Awaitable, Callable, Dict, Type
+
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 
 from infrastructure.behaviors import (
     ApplicationException,
     ValidationException,
 )
-from infrastructure.logging import get_logger
+from infrastructure.logging import get_logger, is_info_enabled
 from interfaces.api.middleware.logging_middleware import get_request_id
 
+from interfaces.api.responses import DefaultJSONResponse as JSONResponse
+
 logger = get_logger(__name__)
 
 
+def _error_body(code, message, details, request_id) -> dict:
+    """错误响应体的唯一构造点，三个处理器共用同一份骨架"""
+    return {
+        "error": {
+            "code": code,
+            "message": message,
+            "details": details,
+            "request_id": request_id,
+        }
+    }
+
+
 async def application_exception_handler(
     request: Request,
     exc: ApplicationException
@@ -39,20 +54,14 @@ async def application_exception_handler(
     request_id = get_request_id() or "-"
     error = exc.error
 
-    logger.info(
-        f"[{request_id}] ApplicationException: {error.code} - {error.message}"
-    )
+    if is_info_enabled():
+        logger.info(
+            f"[{request_id}] ApplicationException: {error.code} - {error.message}"
+        )
 
     return JSONResponse(
         status_code=error.status_code,
-        content={
-            "error": {
-                "code": error.code,
-                "message": error.message,
-                "details": error.details,
-                "request_id": request_id,
-            }
-        }
+        content=_error_body(error.code, error.message, error.details, request_id),
     )
 
 
@@ -67,23 +76,17 @@ async def validation_exception_handler(
     """
     request_id = get_request_id() or "-"
 
-    logger.info(
-        f"[{request_id}] ValidationException: {exc.request_type} - "
-        f"{len(exc.errors)} error(s)"
-    )
+    if is_info_enabled():
+        logger.info(
+            f"[{request_id}] ValidationException: {exc.request_type} - "
+            f"{len(exc.errors)} error(s)"
+        )
 
     return JSONResponse(
         status_code=422,
-        content={
-            "error": {
-                "code": "VALIDATION_ERROR",
-                "message": exc.message,
-                "details": {
-                    "errors": exc.errors,
-                },
-                "request_id": request_id,
-            }
-        }
+        content=_error_body(
+            "VALIDATION_ERROR", exc.message, {"errors": exc.errors}, request_id
+        ),
     )
 
 
@@ -99,34 +102,59 @@ async def pydantic_validation_exception_handler(
     """
     request_id = get_request_id() or "-"
 
+    # include_* 过滤掉我们不返回的 url/ctx/input 字段，
+    # 省去 Pydantic v2 默认生成这些内容的格式化成本
     errors = [
         {
-            "field": ".".join(str(loc) for loc in err["loc"]),
+            "field": ".".join(map(str, err["loc"])),
             "message": err["msg"],
             "type": err["type"]
         }
-        for err in exc.errors()
+        for err in exc.errors(
+            include_url=False, include_context=False, include_input=False
+        )
     ]
 
-    logger.info(
-        f"[{request_id}] Pydantic ValidationError: {len(errors)} error(s)"
-    )
+    if is_info_enabled():
+        logger.info(
+            f"[{request_id}] Pydantic ValidationError: {len(errors)} error(s)"
+        )
 
     return JSONResponse(
         status_code=422,
-        content={
-            "error": {
-                "code": "VALIDATION_ERROR",
-                "message": "Request validation failed",
-                "details": {
-                    "errors": errors,
-                },
-                "request_id": request_id,
-            }
-        }
+        content=_error_body(
+            "VALIDATION_ERROR",
+            "Request validation failed",
+            {"errors": errors},
+            request_id,
+        ),
     )
 
 
+# 按具体类型直查的分发表：首次遇到的子类经 isinstance 判定后
+# 记入表中，后续同类型异常一次 dict.get 命中，
+# 不再重复走 isinstance 链
+_HANDLERS: Dict[Type[BaseException], Callable[..., Awaitable[JSONResponse]]] = {
+    ApplicationException: application_exception_handler,
+    ValidationException: validation_exception_handler,
+    ValidationError: pydantic_validation_exception_handler,
+}
+
+
+async def _unified_handler(request: Request, exc: BaseException) -> JSONResponse:
+    """统一入口：type(exc) 直查分发表，未命中时按 isinstance 补登"""
+    handler = _HANDLERS.get(type(exc))
+    if handler is None:
+        if isinstance(exc, ValidationException):
+            handler = validation_exception_handler
+        elif isinstance(exc, ApplicationException):
+            handler = application_exception_handler
+        else:
+            handler = pydantic_validation_exception_handler
+        _HANDLERS[type(exc)] = handler
+    return await handler(request, exc)
+
+
 def register_exception_handlers(app: FastAPI) -> None:
     """
     注册所有异常处理器
@@ -134,8 +162,8 @@ def register_exception_handlers(app: FastAPI) -> None:
     Args:
         app: FastAPI 应用实例
     """
-    app.add_exception_handler(ApplicationException, application_exception_handler)
-    app.add_exception_handler(ValidationException, validation_exception_handler)
-    app.add_exception_handler(ValidationError, pydantic_validation_exception_handler)
+    app.add_exception_handler(ApplicationException, _unified_handler)
+    app.add_exception_handler(ValidationException, _unified_handler)
+    app.add_exception_handler(ValidationError, _unified_handler)
 
     logger.debug("Exception handlers registered")
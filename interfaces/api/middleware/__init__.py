@@ -5,5 +5,6 @@ API 中间件模块
 """
 
 from interfaces.api.middleware.api_key_middleware import APIKeyMiddleware, mask_api_key
+from interfaces.api.middleware.mediator_middleware import MediatorMiddleware
 
-__all__ = ["APIKeyMiddleware", "mask_api_key"]
+__all__ = ["APIKeyMiddleware", "MediatorMiddleware", "mask_api_key"]
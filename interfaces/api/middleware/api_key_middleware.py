@@ -1,15 +1,25 @@
 """
 API Key 认证中间件
 
-使用 Starlette 中间件模式，同时保护 REST API 和 FastMCP 路由。
+纯 ASGI 实现，同时保护 REST API 和 FastMCP 路由。
+不经过 BaseHTTPMiddleware：省掉其每请求的 anyio 任务组
+和响应流包装（本中间件只看路径和 header，不碰 body）。
 """
 
+import re
 import secrets
 from typing import Set, Optional
 
-from fastapi import Request
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware  # FastAPI 未重新导出此类
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from infrastructure.logging import get_logger
+from interfaces.api.responses import DefaultJSONResponse as JSONResponse
+
+logger = get_logger(__name__)
+
+
+# 短于等于此长度的 key 全部打码，避免掩码后仍可逆推
+_MASK_MIN_LEN = 8
 
 
 def mask_api_key(api_key: str | None) -> str:
@@ -22,16 +32,17 @@ def mask_api_key(api_key: str | None) -> str:
     Returns:
         掩码后的 API Key，如 "sk-***abc"
     """
-    if api_key is None or api_key == "":
-        return "***"
-    if len(api_key) <= 8:
-        return "***"
-    return f"{api_key[:3]}***{api_key[-3:]}"
+    # 单表达式：None/空/过短合并成一个条件，无中间分支
+    return (
+        "***"
+        if not api_key or len(api_key) <= _MASK_MIN_LEN
+        else api_key[:3] + "***" + api_key[-3:]
+    )
 
 
-class APIKeyMiddleware(BaseHTTPMiddleware):
+class APIKeyMiddleware:
     """
-    API Key 认证中间件
+    API Key 认证中间件（纯 ASGI）
 
     同时保护 REST API 和 FastMCP 路由（/tools/*）
 
@@ -51,7 +62,7 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         api_key: str,
         whitelist_paths: Optional[Set[str]] = None,
         header_name: str = "X-API-Key"
@@ -65,18 +76,43 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
             whitelist_paths: 额外的白名单路径（可选）
             header_name: API Key header 名称，默认 "X-API-Key"
         """
-        super().__init__(app)
+        self.app = app
         self.api_key = api_key
         self.header_name = header_name
 
+        # 预编码为 bytes：热路径直接扫 scope["headers"] 的
+        # (bytes, bytes) 原始列表，不构造 Headers 多重字典
+        self._header_key = header_name.lower().encode("latin-1")
+        self._api_key_bytes = api_key.encode("latin-1")
+
+        # 配置的 key 启动后不变，掩码形式算一次缓存；
+        # 日志里引用自身 key 时直接用，不再重复掩码
+        self._masked_self = mask_api_key(api_key)
+
         # 合并默认白名单和用户自定义白名单
         self.whitelist_paths = self.DEFAULT_WHITELIST_PATHS.copy()
         if whitelist_paths:
             self.whitelist_paths.update(whitelist_paths)
 
+        # 预编译为单个正则：精确匹配或子路径前缀（长路径在前，
+        # 避免短前缀抢先命中），热路径一次 C 级 match 完成判定
+        self._whitelist_re = re.compile(
+            "^(?:"
+            + "|".join(
+                re.escape(p)
+                for p in sorted(self.whitelist_paths, key=len, reverse=True)
+            )
+            + ")(?:/|$)"
+        )
+
+        logger.debug(
+            f"API key auth enabled: key={self._masked_self}, "
+            f"header={header_name}, whitelist={len(self.whitelist_paths)} paths"
+        )
+
     def _is_whitelisted(self, path: str) -> bool:
         """
-        检查路径是否在白名单中
+        检查路径是否在白名单中（精确匹配或子路径）
 
         Args:
             path: 请求路径
@@ -84,47 +120,45 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
         Returns:
             是否在白名单中
         """
-        # 精确匹配
-        if path in self.whitelist_paths:
-            return True
+        return self._whitelist_re.match(path) is not None
 
-        # 检查是否以白名单路径开头（支持子路径）
-        for whitelist_path in self.whitelist_paths:
-            if path.startswith(whitelist_path + "/"):
-                return True
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGI 入口"""
+        # lifespan/websocket 等非 HTTP scope 直接透传
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        return False
-
-    async def dispatch(self, request: Request, call_next):
-        """
-        处理请求
-
-        Args:
-            request: HTTP 请求
-            call_next: 下一个处理器
-
-        Returns:
-            HTTP 响应
-        """
         # 白名单路径跳过认证
-        if self._is_whitelisted(request.url.path):
-            return await call_next(request)
-
-        # 获取 API Key
-        api_key = request.headers.get(self.header_name)
+        if self._whitelist_re.match(scope["path"]) is not None:
+            await self.app(scope, receive, send)
+            return
+
+        # 获取 API Key：单 header 查找直接线性扫原始列表，
+        # 避免为一次取值构建整个 Headers 对象
+        api_key = None
+        header_key = self._header_key
+        for name, value in scope["headers"]:
+            if name == header_key:
+                api_key = value
+                break
 
         # 检查 API Key 是否存在
         if api_key is None:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=401,
                 content={"detail": "API Key required"}
             )
+            await response(scope, receive, send)
+            return
 
-        # 安全比较防止时序攻击
-        if not secrets.compare_digest(api_key, self.api_key):
-            return JSONResponse(
+        # 安全比较防止时序攻击（bytes 对 bytes，无需解码）
+        if not secrets.compare_digest(api_key, self._api_key_bytes):
+            response = JSONResponse(
                 status_code=401,
                 content={"detail": "Invalid API Key"}
             )
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -3,12 +3,16 @@
 
 在每个请求开始时创建 Session，结束时关闭并归还到连接池。
 解决连接池耗尽问题。
+
+纯 ASGI 实现：不经过 BaseHTTPMiddleware 的 anyio 任务组
+和响应流包装，每请求少一次任务组创建/销毁。
 """
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+import re
+from typing import Optional, Set
+
 from sqlalchemy.orm import sessionmaker
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from infrastructure.containers.infrastructure import set_request_session
 from infrastructure.logging import get_logger
@@ -16,19 +20,54 @@ from infrastructure.logging import get_logger
 logger = get_logger(__name__)
 
 
-class DBSessionMiddleware(BaseHTTPMiddleware):
+class DBSessionMiddleware:
     """
-    数据库 Session 中间件
+    数据库 Session 中间件（纯 ASGI）
 
     为每个 HTTP 请求创建独立的 Session，并在请求结束时关闭。
     Session 通过 contextvars 存储，可以被 Repository 访问。
+
+    优化：
+    - GET + 配置的无库路径（如 /health、/docs）完全跳过 Session 创建
     """
 
-    def __init__(self, app, session_factory: sessionmaker):
-        super().__init__(app)
+    # 默认不需要数据库的路径（与 APIKeyMiddleware 白名单同一套模式）
+    DEFAULT_SKIP_PATHS: Set[str] = {
+        "/docs",
+        "/openapi.json",
+        "/redoc",
+    }
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        session_factory: sessionmaker,
+        skip_paths: Optional[Set[str]] = None,
+    ):
+        self.app = app
         self._session_factory = session_factory
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+        paths = self.DEFAULT_SKIP_PATHS.copy()
+        if skip_paths:
+            paths.update(skip_paths)
+        # 预编译为单个正则（精确匹配或子路径），同 APIKeyMiddleware
+        self._skip_re = re.compile(
+            "^(?:"
+            + "|".join(re.escape(p) for p in sorted(paths, key=len, reverse=True))
+            + ")(?:/|$)"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGI 入口"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 无库路径的 GET 请求不创建 Session，直接透传
+        if scope["method"] == "GET" and self._skip_re.match(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
         # 创建新的 Session
         session = self._session_factory()
 
@@ -36,12 +75,16 @@ class DBSessionMiddleware(BaseHTTPMiddleware):
         set_request_session(session)
 
         try:
-            response = await call_next(request)
-            # 成功时提交事务（如果有待提交的更改）
+            await self.app(scope, receive, send)
+            # 无条件提交：写入可能已被 flush（TransactionBehavior 释放
+            # SAVEPOINT 时）或走 Core 语句，此时 new/dirty/deleted 均为空，
+            # 不能据此判断"本请求没写过"——那样会把已 flush 的写入回滚掉。
+            # 注意：纯 ASGI 模式下响应此时已发给客户端，COMMIT 失败
+            # 无法再转成错误响应，只能记日志后向上抛。
             await session.commit()
-            return response
         except Exception as e:
             # 发生异常时回滚
+            logger.error(f"request teardown failed, rolling back: {type(e).__name__}: {e}")
             await session.rollback()
             raise
         finally:
@@ -6,17 +6,18 @@ HTTP 请求日志中间件
 - 响应状态码
 - 请求耗时
 - 请求 ID（用于链路追踪）
+
+纯 ASGI 实现：不经过 BaseHTTPMiddleware 的 anyio 任务组
+和响应流包装；状态码从 http.response.start 消息里取。
 """
 
+import os
 import time
-from uuid import uuid4
 from contextvars import ContextVar
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from infrastructure.logging import get_logger
+from infrastructure.logging import get_logger, is_info_enabled
 
 logger = get_logger(__name__)
 
@@ -29,40 +30,58 @@ def get_request_id() -> str:
     return request_id_var.get()
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
-    HTTP 请求日志中间件
+    HTTP 请求日志中间件（纯 ASGI）
 
     自动记录请求开始和结束，包含耗时统计。
     生成唯一请求 ID 用于链路追踪。
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        # 生成请求 ID
-        request_id = uuid4().hex[:8]
-        request_id_var.set(request_id)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        # 记录请求开始
-        method = request.method
-        path = request.url.path
-        logger.info(f"[{request_id}] -> {method} {path}")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGI 入口"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # 计时
-        start = time.perf_counter()
+        # 生成请求 ID（os.urandom 比 uuid4 省去版本位处理和对象构造）
+        request_id = os.urandom(4).hex()
+        # 保留 token 在请求结束时 reset：上下文帧对称收尾，
+        # 请求 ID 不会泄漏到复用本上下文的后续任务里
+        token = request_id_var.set(request_id)
 
-        try:
-            response = await call_next(request)
+        # 级别先判一次：INFO 被关掉时（如生产环境 WARNING+）
+        # 两条请求日志的 f-string 构造整个跳过
+        info_enabled = is_info_enabled()
 
-            # 记录请求结束
-            duration_ms = (time.perf_counter() - start) * 1000
-            logger.info(
-                f"[{request_id}] <- {response.status_code} {duration_ms:.0f}ms"
-            )
+        # 记录请求开始
+        if info_enabled:
+            logger.info(f"[{request_id}] -> {scope['method']} {scope['path']}")
+
+        # 计时：整数纳秒，避免每请求的浮点运算；格式化时才做除法
+        start_ns = time.monotonic_ns()
+        status_code = 500
 
-            return response
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             # 记录异常
-            duration_ms = (time.perf_counter() - start) * 1000
-            logger.error(f"[{request_id}] <- ERROR {type(e).__name__}: {e} {duration_ms:.0f}ms")
+            ms = (time.monotonic_ns() - start_ns) // 1_000_000
+            logger.error(f"[{request_id}] <- ERROR {type(e).__name__}: {e} {ms}ms")
             raise
+        else:
+            # 记录请求结束
+            if info_enabled:
+                ms = (time.monotonic_ns() - start_ns) // 1_000_000
+                logger.info(f"[{request_id}] <- {status_code} {ms}ms")
+        finally:
+            request_id_var.reset(token)
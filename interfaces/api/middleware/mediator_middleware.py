@@ -0,0 +1,57 @@
+"""
+Mediator 注入中间件
+
+把 Mediator 实例挂到 request.state.mediator，
+处理器可以直接属性访问，绕过 FastAPI 的 Depends 解析
+（签名检查、scope 缓存、协程包装）。
+
+纯 ASGI 实现：写入 scope["state"]（Starlette 的
+request.state 就是它的视图），每请求只有一次字典赋值，
+没有 BaseHTTPMiddleware 的任务组/响应包装开销。
+"""
+
+from typing import Callable, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+from mediatr import Mediator
+
+
+class MediatorMiddleware:
+    """
+    Mediator 注入中间件（纯 ASGI）
+
+    用法（处理器内）：
+        @app.post("/accounts")
+        async def create(cmd: CreateCmd, request: Request):
+            return await request.state.mediator.send_async(cmd)
+    """
+
+    def __init__(self, app: ASGIApp, mediator_getter: Callable[[], Mediator]):
+        """
+        初始化中间件
+
+        Args:
+            app: ASGI 应用
+            mediator_getter: 返回 Mediator 的获取器；
+                首次请求时解析一次并缓存
+        """
+        self.app = app
+        self._mediator_getter = mediator_getter
+        self._mediator: Optional[Mediator] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGI 入口"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        mediator = self._mediator
+        if mediator is None:
+            mediator = self._mediator = self._mediator_getter()
+
+        # request.state 由 scope["state"] 支撑，这里直接写字典
+        if "state" not in scope:
+            scope["state"] = {}
+        scope["state"]["mediator"] = mediator
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,16 @@
+"""
+JSON 响应类选择
+
+orjson（Rust 实现）可用时使用 ORJSONResponse，序列化比标准库
+json 快数倍且原生支持 datetime/UUID；未安装时回退到标准
+JSONResponse，行为不变。orjson 是可选加速项，不是硬依赖。
+"""
+
+try:
+    import orjson  # noqa: F401
+
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+except ImportError:  # orjson 未安装，退回标准库实现
+    from fastapi.responses import JSONResponse as DefaultJSONResponse
+
+__all__ = ["DefaultJSONResponse"]
@@ -7,6 +7,8 @@
 - 监控系统
 """
 
+import asyncio
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -15,11 +17,21 @@ from pydantic import BaseModel
 from sqlalchemy import text
 
 from infrastructure.containers.bootstrap import get_bootstrap
-from infrastructure.config.settings import Settings
+from infrastructure.config.settings import get_settings
 
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
+# 模块级常量：每次探针不必重新构造/解析 SQL 文本
+_PING = text("SELECT 1")
+
+# 探针响应的短 TTL 缓存：多副本 Kubernetes 探针每秒打多次，
+# 1 秒内的重复探测直接复用结果，/ready 的 DB 检查被折叠成每秒一次
+_TTL = 1.0
+_cache: Optional[tuple] = None          # (monotonic 时间戳, HealthResponse)
+_ready_cache: Optional[tuple] = None
+_ready_lock = asyncio.Lock()            # singleflight：并发探针只打一次 DB
+
 
 class HealthResponse(BaseModel):
     """健康检查响应"""
@@ -36,16 +48,24 @@ async def health_check() -> HealthResponse:
     基础健康检查
 
     返回服务状态、版本和环境信息。
+    结果缓存 1 秒，探针风暴不放大为重复计算。
     """
-    boot = get_bootstrap()
-    settings = boot.infra.settings()
+    global _cache
+    now = time.monotonic()
+    if _cache is not None and now - _cache[0] < _TTL:
+        return _cache[1]
 
-    return HealthResponse(
+    # get_settings 是 lru_cache 单例：热路径不再穿过 DI 容器
+    settings = get_settings()
+
+    response = HealthResponse(
         status="ok",
         version="1.0.0",
         environment=settings.app_env,
         timestamp=datetime.now(),
     )
+    _cache = (now, response)
+    return response
 
 
 @router.get("/ready", response_model=HealthResponse)
@@ -55,24 +75,38 @@ async def readiness_check() -> HealthResponse:
 
     检查服务是否准备好接收请求。
     用于 Kubernetes readiness probe。
+    结果缓存 1 秒，并发探针合并为一次 DB 检查（singleflight）。
     """
-    boot = get_bootstrap()
-    settings = boot.infra.settings()
-
-    # 检查数据库连接
-    db_status = "unknown"
-    try:
-        session_factory = boot.infra.db_session_factory()
-        async with session_factory() as session:
-            await session.execute(text("SELECT 1"))
-        db_status = "connected"
-    except Exception as e:
-        db_status = f"error: {str(e)}"
-
-    return HealthResponse(
-        status="ok" if db_status == "connected" else "degraded",
-        version="1.0.0",
-        environment=settings.app_env,
-        timestamp=datetime.now(),
-        database=db_status,
-    )
+    global _ready_cache
+    now = time.monotonic()
+    if _ready_cache is not None and now - _ready_cache[0] < _TTL:
+        return _ready_cache[1]
+
+    async with _ready_lock:
+        # 拿到锁后复查：等待期间可能已有探针写入了新结果
+        now = time.monotonic()
+        if _ready_cache is not None and now - _ready_cache[0] < _TTL:
+            return _ready_cache[1]
+
+        boot = get_bootstrap()
+        settings = get_settings()
+
+        # 检查数据库连接
+        db_status = "unknown"
+        try:
+            session_factory = boot.infra.db_session_factory()
+            async with session_factory() as session:
+                await session.execute(_PING)
+            db_status = "connected"
+        except Exception as e:
+            db_status = f"error: {str(e)}"
+
+        response = HealthResponse(
+            status="ok" if db_status == "connected" else "degraded",
+            version="1.0.0",
+            environment=settings.app_env,
+            timestamp=datetime.now(),
+            database=db_status,
+        )
+        _ready_cache = (now, response)
+        return response